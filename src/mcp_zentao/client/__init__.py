@@ -4,16 +4,39 @@
 提供类型安全的禅道API访问功能。
 """
 
-from .base_client import BaseClient
-from .session_client import SessionClient
-from .user_client import UserClient
-from .project_client import ProjectClient
-from .task_client import TaskClient
-from .bug_client import BugClient
-from .zentao_client import ZenTaoClient
+import importlib
+from typing import Any, Dict, List
+
+from .base_client import BaseClient, SessionState
+
+# 各子客户端在首次访问时才导入（PEP 562），连同其依赖的数据模型一起按需加载
+_LAZY_EXPORTS: Dict[str, str] = {
+    "SessionClient": "session_client",
+    "UserClient": "user_client",
+    "ProjectClient": "project_client",
+    "TaskClient": "task_client",
+    "BugClient": "bug_client",
+    "ZenTaoClient": "zentao_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入子客户端所在的模块，并缓存到包的命名空间中"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BaseClient",
+    "SessionState",
     "SessionClient", 
     "UserClient",
     "ProjectClient",
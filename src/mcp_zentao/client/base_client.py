@@ -4,15 +4,172 @@
 提供HTTP请求、错误处理、响应解析等基础功能。
 """
 
+import asyncio
+import functools
+import importlib.util
 import json
-from typing import Any, Dict, Optional, Type, TypeVar, Union, List
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from urllib.parse import quote
+from typing import (
+    Any, Callable, ClassVar, Dict, Hashable, Iterator, List, Mapping, NoReturn,
+    Optional, Protocol, Tuple, Type, TypeVar, Union, runtime_checkable
+)
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from ..models.common import BaseResponse, ResponseStatus, ZenTaoError
+from ..models.common import (
+    STATUS_CHECK_CONTEXT, APIResponse, BaseResponse, ResponseStatus, ZenTaoError,
+    json_loads, orjson
+)
 from ..models.pagination import PaginationHelper, PagerInfo, PageParams
 
 T = TypeVar('T', bound=BaseModel)
+R = TypeVar('R')
+F = TypeVar('F', bound=Callable[..., Any])
+
+logger = logging.getLogger(__name__)
+
+# 并发获取分页数据时的默认工作线程数
+DEFAULT_PAGE_WORKERS = 8
+
+# 构建URL路径时无需转义的字符
+_PATH_SAFE_CHARS = "/-_.~!$&'()*+,;=:@%"
+
+# JSON请求体的内容类型
+JSON_CONTENT_HEADERS = {'Content-Type': 'application/json'}
+
+# 网关类错误的最大重试次数及退避基数（秒），第n次重试前等待约 RETRY_BACKOFF * 2**n（含随机抖动）
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2
+
+# 触发重试的HTTP状态码；非幂等请求仅在 503（请求未被处理）时重试
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+# 单个客户端同时进行中的最大请求数，避免并发获取时压垮禅道服务器
+DEFAULT_MAX_CONCURRENCY = 16
+
+# 响应缓存（ETag条件请求与TTL缓存）的最大条目数
+RESPONSE_CACHE_SIZE = 512
+
+# 分页总记录数缓存的最大条目数
+REC_TOTAL_CACHE_SIZE = 128
+
+# HTTP/2 需要 h2 包（httpx[http2]）；未安装时退回 HTTP/1.1 长连接。
+# 服务端不支持 HTTP/2 时，TLS 协商（ALPN）会自动使用 HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# HTTP连接池配置：保持长连接，并允许并发请求在HTTP/2下复用同一连接
+DEFAULT_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=32,
+    keepalive_expiry=85.0,
+)
+
+
+def create_http_client(
+    timeout: float,
+    limits: httpx.Limits = DEFAULT_HTTP_LIMITS,
+    **kwargs: Any
+) -> httpx.Client:
+    """创建启用HTTP/2（可用时）与连接池的HTTP客户端
+    
+    Args:
+        timeout: 请求超时时间
+        limits: 连接池配置（最大连接数、长连接数及其保持时间）
+        **kwargs: 传递给 httpx.Client 的其他参数
+        
+    Returns:
+        HTTP客户端实例
+    """
+    # 传输层在建立连接失败时自动重试，此时请求尚未发出，对任何方法都是安全的
+    transport = httpx.HTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=limits,
+        retries=MAX_RETRIES,
+    )
+    return httpx.Client(
+        transport=transport,
+        timeout=timeout,
+        **kwargs
+    )
+
+
+def requires_session(message: str) -> Callable[[F], F]:
+    """要求客户端已登录（持有会话ID）的方法装饰器
+    
+    Args:
+        message: 未登录时 ValueError 的错误消息
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(self: 'BaseClient', *args: Any, **kwargs: Any) -> Any:
+            # 会话ID只会是经过校验的非空字符串或None，直接读共享状态并做身份比较
+            if self._session_state.session_id is None:
+                raise ValueError(message)
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=64)
+def _adapter(model: Type[T]) -> TypeAdapter[T]:
+    """获取响应模型的 TypeAdapter，按模型类缓存"""
+    return TypeAdapter(model)
+
+
+@dataclass(slots=True)
+class SessionState:
+    """登录会话状态
+    
+    ZenTaoClient 的各个子客户端持有同一个实例，
+    会话ID在登录/登出时只需更新一处，所有子客户端立即可见。
+    
+    Args:
+        session_id: 当前会话ID，未登录时为 None
+    """
+    
+    session_id: Optional[str] = None
+
+
+@runtime_checkable
+class _HasRecTotal(Protocol):
+    """能够提供总记录数的分页列表响应"""
+    
+    def get_rec_total(self) -> int: ...
+
+
+class _KeepMissing(dict):
+    """格式化端点时保留未提供的占位符原样"""
+    
+    def __missing__(self, key: str) -> str:
+        return f'{{{key}}}'
+
+
+def _freeze_params(params: Optional[Mapping[str, Any]]) -> Optional[Tuple[Tuple[str, Hashable], ...]]:
+    """将请求参数转换为可哈希的缓存键片段
+    
+    参数按名称排序；列表、字典等不可哈希的值以 repr 代替，
+    因此包含这类值的请求同样可以缓存，而不会抛出 TypeError。
+    """
+    if not params:
+        return None
+    frozen = []
+    for name, value in params.items():
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        frozen.append((str(name), value))
+    frozen.sort(key=lambda item: item[0])
+    return tuple(frozen)
 
 
 class BaseClient:
@@ -22,27 +179,84 @@ class BaseClient:
     所有具体的客户端都应该继承此类。
     """
     
-    def __init__(self, base_url: str, timeout: float = 30.0) -> None:
+    __slots__ = (
+        'base_url', 'timeout', '_base_url_obj', '_base_path', '_session_state',
+        '_owns_client', '_client', '_response_cache', '_response_cache_lock',
+        '_rec_total_cache', '_request_slots', '_inflight', '_inflight_lock',
+    )
+    
+    # 默认请求头，所有实例共享同一个只读映射
+    _DEFAULT_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'User-Agent': 'MCP-ZenTao-Client/1.0',
+        'Accept': 'application/json',
+        'Connection': 'keep-alive',
+    })
+    
+    # GET响应的缓存有效期（秒），有效期内的相同请求直接返回缓存结果；
+    # None 表示不按时间缓存，仅通过ETag条件请求复用
+    response_cache_ttl: ClassVar[Optional[float]] = None
+    
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30.0,
+        client: Optional[httpx.Client] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        session_state: Optional[SessionState] = None,
+        request_slots: Optional[threading.BoundedSemaphore] = None
+    ) -> None:
         """初始化基础客户端
         
         Args:
             base_url: 禅道系统的基础URL，例如 http://localhost/zentao/
             timeout: 请求超时时间，默认30秒
+            client: 共享的HTTP客户端。传入时复用其连接池和Cookie，
+                且不会在 close() 时关闭它；为None时自行创建
+            max_concurrency: 同时进行中的最大请求数
+            session_state: 共享的会话状态。传入时与其他客户端共享会话ID；
+                为None时使用独立的会话状态
+            request_slots: 共享的并发请求限流信号量。传入时与其他客户端共同受其限制，
+                忽略 max_concurrency；为None时按 max_concurrency 单独限流
         """
         self.base_url = base_url.rstrip('/')
+        # 预先解析基础URL，构建请求URL时只替换路径部分
+        self._base_url_obj = httpx.URL(self.base_url)
+        self._base_path = self._base_url_obj.raw_path.rstrip(b'/') + b'/'
         self.timeout = timeout
-        self._session_id: Optional[str] = None
-        
-        # 创建HTTP客户端（支持cookies以维持会话状态）
-        self._client = httpx.Client(
-            timeout=timeout,
-            headers={
-                'User-Agent': 'MCP-ZenTao-Client/1.0',
-                'Accept': 'application/json',
-            },
-            # 启用cookie支持以维持会话状态
-            cookies=httpx.Cookies()
+        self._session_state = session_state if session_state is not None else SessionState()
+        self._owns_client = client is None
+        
+        if client is None:
+            # 创建HTTP客户端（支持cookies以维持会话状态）
+            client = create_http_client(
+                timeout,
+                headers=self._DEFAULT_HEADERS,
+                # 启用cookie支持以维持会话状态
+                cookies=httpx.Cookies()
+            )
+        self._client = client
+        
+        # 响应缓存：请求键 -> (ETag, 已解析的响应模型, 缓存时间)
+        self._response_cache: 'OrderedDict[Hashable, Tuple[Optional[str], BaseModel, float]]' = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
+        # 分页总记录数缓存：(基础端点, 会话ID, 查询参数, 路径参数) -> 总记录数，
+        # 与响应缓存共用同一把锁，并随 clear_cache 一起清除
+        self._rec_total_cache: 'OrderedDict[Hashable, int]' = OrderedDict()
+        
+        # 并发请求限流
+        self._request_slots = (
+            request_slots if request_slots is not None
+            else threading.BoundedSemaphore(max_concurrency)
         )
+        
+        # 进行中的GET请求：请求键 -> 结果Future，相同的并发请求共享同一次响应
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def get_http_client(self) -> httpx.Client:
+        """获取底层的HTTP客户端，供需要自定义请求的高级用法使用"""
+        return self._client
     
     def __enter__(self) -> 'BaseClient':
         """上下文管理器进入"""
@@ -53,23 +267,25 @@ class BaseClient:
         self.close()
     
     def close(self) -> None:
-        """关闭HTTP客户端"""
-        if hasattr(self, '_client'):
+        """关闭HTTP客户端（共享的HTTP客户端由其创建者负责关闭）"""
+        if self._owns_client:
             self._client.close()
     
     @property
     def session_id(self) -> Optional[str]:
         """获取当前会话ID"""
-        return self._session_id
+        return self._session_state.session_id
     
     @session_id.setter
     def session_id(self, value: Optional[str]) -> None:
-        """设置会话ID"""
-        self._session_id = value
+        """设置会话ID（共享会话状态的所有客户端同时生效）"""
+        self._session_state.session_id = value
     
-    def _build_url(self, endpoint: str, **params: Any) -> str:
+    def _build_url(self, endpoint: str, **params: Any) -> httpx.URL:
         """构建完整的API URL
         
+        基于预先解析的基础URL只替换路径，httpx 无需再次解析整个URL字符串。
+        
         Args:
             endpoint: API端点，例如 'api-getSessionID.json'
             **params: URL参数，如sessionid等
@@ -77,13 +293,10 @@ class BaseClient:
         Returns:
             完整的API URL
         """
-        # 替换URL中的参数占位符
-        for key, value in params.items():
-            placeholder = f'{{{key}}}'
-            if placeholder in endpoint:
-                endpoint = endpoint.replace(placeholder, str(value))
-        
-        return f"{self.base_url}/{endpoint}"
+        if '{' in endpoint:
+            endpoint = endpoint.format_map(_KeepMissing(params))
+        path = quote(endpoint, safe=_PATH_SAFE_CHARS).encode('ascii')
+        return self._base_url_obj.copy_with(raw_path=self._base_path + path)
     
     def _make_request(
         self,
@@ -91,6 +304,8 @@ class BaseClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
         **url_params: Any
     ) -> httpx.Response:
         """发起HTTP请求
@@ -99,11 +314,13 @@ class BaseClient:
             method: HTTP方法 (GET, POST, PUT, DELETE)
             endpoint: API端点
             params: URL查询参数
-            data: 请求体数据
+            data: 请求体数据，序列化为JSON发送
+            headers: 额外的请求头
+            content: 已序列化的JSON请求体，提供时忽略 data
             **url_params: URL路径参数
             
         Returns:
-            HTTP响应对象
+            HTTP响应对象（304 Not Modified 不视为错误）
             
         Raises:
             ZenTaoError: 禅道API错误
@@ -111,14 +328,16 @@ class BaseClient:
         """
         url = self._build_url(endpoint, **url_params)
         
+        if content is None and data:
+            content = self._encode_json(data)
+        if content is not None:
+            headers = {**headers, **JSON_CONTENT_HEADERS} if headers else JSON_CONTENT_HEADERS
+        
         try:
-            response = self._client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data if data else None
-            )
-            response.raise_for_status()
+            response = self._send_with_retry(method, url, params, content, headers)
+            logger.debug("%s %s -> %s %s", method, url, response.http_version, response.status_code)
+            if response.status_code != httpx.codes.NOT_MODIFIED:
+                response.raise_for_status()
             return response
             
         except httpx.HTTPStatusError as e:
@@ -134,6 +353,52 @@ class BaseClient:
                 data=None
             )
     
+    def _send_with_retry(
+        self,
+        method: str,
+        url: httpx.URL,
+        params: Optional[Dict[str, Any]],
+        content: Optional[bytes],
+        headers: Optional[Dict[str, str]]
+    ) -> httpx.Response:
+        """发送请求，遇到网关类错误或网络错误时按指数退避重试
+        
+        连接建立失败由传输层重试；请求发出后的网络错误（如读取超时）
+        可能意味着服务端已处理了请求，因此只对幂等请求重试。
+        """
+        idempotent = method in IDEMPOTENT_METHODS
+        retry_codes = RETRY_STATUS_CODES if idempotent else {503}
+        for attempt in range(MAX_RETRIES + 1):
+            last_attempt = attempt == MAX_RETRIES
+            try:
+                with self._request_slots:
+                    response = self._client.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        content=content,
+                        headers=headers
+                    )
+            except httpx.TransportError as e:
+                if not idempotent or last_attempt:
+                    raise
+                logger.debug("%s %s -> %r, 第%d次重试", method, url, e, attempt + 1)
+            else:
+                if response.status_code not in retry_codes or last_attempt:
+                    return response
+                logger.debug("%s %s -> %s, 第%d次重试", method, url, response.status_code, attempt + 1)
+                response.close()
+            # 等待期间不占用并发名额；加入随机抖动，避免并发请求同时重试
+            time.sleep(RETRY_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5))
+        return response
+    
+    @staticmethod
+    def _encode_json(data: Dict[str, Any]) -> bytes:
+        """将请求体序列化为JSON字节"""
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
     def _parse_response(
         self,
         response: httpx.Response,
@@ -151,16 +416,49 @@ class BaseClient:
         Raises:
             ZenTaoError: 数据解析错误或API错误
         """
+        # 单次解析：直接从原始字节解析并校验为数据模型，
+        # APIResponse 子类在校验过程中即对非成功状态抛出 ZenTaoError
         try:
-            response_data = response.json()
-        except json.JSONDecodeError as e:
+            parsed = _adapter(response_model).validate_json(
+                response.content, context=STATUS_CHECK_CONTEXT
+            )
+        except ValidationError as e:
+            self._raise_for_invalid_response(response.content, e)
+        
+        # 其他数据模型在此检查API响应状态
+        if not isinstance(parsed, APIResponse):
+            status = getattr(parsed, 'status', None)
+            if status != 'success':
+                raise ZenTaoError(
+                    status=getattr(status, 'value', status) or "error",
+                    message=getattr(parsed, 'message', None) or '未知错误',
+                    data=getattr(parsed, 'data', None)
+                )
+        
+        return parsed
+    
+    def _raise_for_invalid_response(self, content: bytes, error: ValidationError) -> NoReturn:
+        """将无法通过模型校验的响应转换为对应的禅道错误
+        
+        仅在校验失败时重新解析原始JSON，用于区分JSON格式错误、
+        API返回的错误状态以及数据模型不匹配。
+        
+        Args:
+            content: 原始响应内容
+            error: 模型校验异常
+            
+        Raises:
+            ZenTaoError: 总是抛出
+        """
+        try:
+            response_data = json_loads(content)
+        except ValueError as e:
             raise ZenTaoError(
                 status="error",
                 message=f"JSON解析错误: {str(e)}",
                 data=None
             )
         
-        # 检查API响应状态
         if not isinstance(response_data, dict):
             raise ZenTaoError(
                 status="error",
@@ -170,28 +468,24 @@ class BaseClient:
         
         status = response_data.get('status')
         if status != 'success':
-            error_message = response_data.get('message', '未知错误')
             raise ZenTaoError(
                 status=status or "error",
-                message=error_message,
+                message=response_data.get('message', '未知错误'),
                 data=response_data.get('data')
             )
         
-        # 解析为指定的数据模型
-        try:
-            return response_model.model_validate(response_data)
-        except Exception as e:
-            raise ZenTaoError(
-                status="error",
-                message=f"数据模型验证失败: {str(e)}",
-                data=response_data
-            )
+        raise ZenTaoError(
+            status="error",
+            message=f"数据模型验证失败: {str(error)}",
+            data=response_data
+        )
     
     def get(
         self,
         endpoint: str,
         response_model: Type[T],
         params: Optional[Dict[str, Any]] = None,
+        cache: bool = True,
         **url_params: Any
     ) -> T:
         """发起GET请求
@@ -200,13 +494,119 @@ class BaseClient:
             endpoint: API端点
             response_model: 响应数据模型类
             params: URL查询参数
+            cache: 是否使用响应缓存。会话、登录等请求（参数中可能含有密码）应传入False，
+                此时不读写缓存、不发送 If-None-Match，也不与其他请求合并
             **url_params: URL路径参数
             
         Returns:
             解析后的响应数据
+            
+        Note:
+            设置了 response_cache_ttl 时，有效期内的相同请求直接返回缓存结果。
+            服务端返回ETag时会缓存解析结果，后续相同请求携带 If-None-Match，
+            收到 304 Not Modified 时直接复用缓存的模型，无需重新下载和校验。
+            多个线程同时发起相同的请求时只发送一次，其余线程等待并共享结果。
+            缓存命中和合并请求返回的是同一个模型实例，调用方不得修改返回值，
+            需要修改时请先 model_copy(deep=True)。
         """
-        response = self._make_request('GET', endpoint, params=params, **url_params)
-        return self._parse_response(response, response_model)
+        if not cache:
+            response = self._make_request('GET', endpoint, params=params, **url_params)
+            return self._parse_response(response, response_model)
+        
+        cache_key = self._request_cache_key(endpoint, response_model, params, url_params)
+        
+        with self._inflight_lock:
+            leader = self._inflight.get(cache_key)
+            if leader is None:
+                future: Future = Future()
+                self._inflight[cache_key] = future
+        if leader is not None:
+            return leader.result()
+        
+        try:
+            result = self._get_uncoalesced(cache_key, endpoint, response_model, params, url_params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+    
+    def _get_uncoalesced(
+        self,
+        cache_key: Hashable,
+        endpoint: str,
+        response_model: Type[T],
+        params: Optional[Dict[str, Any]],
+        url_params: Dict[str, Any]
+    ) -> T:
+        """实际发起GET请求（处理TTL缓存与ETag条件请求）"""
+        ttl = self.response_cache_ttl
+        cached = self._get_cache_entry(cache_key)
+        if cached is not None and ttl is not None and time.monotonic() - cached[2] < ttl:
+            return cached[1]
+        
+        headers = {'If-None-Match': cached[0]} if cached and cached[0] else None
+        response = self._make_request('GET', endpoint, params=params, headers=headers, **url_params)
+        if headers and response.status_code == httpx.codes.NOT_MODIFIED:
+            self._store_cache_entry(cache_key, cached[0], cached[1])
+            return cached[1]
+        
+        parsed = self._parse_response(response, response_model)
+        etag = response.headers.get('ETag')
+        if etag or ttl is not None:
+            self._store_cache_entry(cache_key, etag, parsed)
+        return parsed
+    
+    def _request_cache_key(
+        self,
+        endpoint: str,
+        response_model: Type[BaseModel],
+        params: Optional[Dict[str, Any]],
+        url_params: Dict[str, Any]
+    ) -> Hashable:
+        """构建请求缓存键（包含会话ID，不同会话之间不共享缓存）"""
+        return (
+            endpoint,
+            self._session_state.session_id,
+            response_model,
+            _freeze_params(params),
+            _freeze_params(url_params),
+        )
+    
+    def _get_cache_entry(self, key: Hashable) -> Optional[Tuple[Optional[str], BaseModel, float]]:
+        """读取响应缓存条目，并标记为最近使用"""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                self._response_cache.move_to_end(key)
+            return entry
+    
+    def _store_cache_entry(self, key: Hashable, etag: Optional[str], parsed: BaseModel) -> None:
+        """写入响应缓存条目，超出容量时淘汰最久未使用的条目"""
+        with self._response_cache_lock:
+            self._response_cache[key] = (etag, parsed, time.monotonic())
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    def clear_cache(self, endpoint_prefix: Optional[str] = None) -> None:
+        """清除响应缓存及分页总记录数缓存
+        
+        Args:
+            endpoint_prefix: 只清除端点模板以此开头的缓存，None表示全部清除
+        """
+        with self._response_cache_lock:
+            for cache in (self._response_cache, self._rec_total_cache):
+                if endpoint_prefix is None:
+                    cache.clear()
+                    continue
+                stale = [key for key in cache if key[0].startswith(endpoint_prefix)]
+                for key in stale:
+                    del cache[key]
     
     def post(
         self,
@@ -214,6 +614,7 @@ class BaseClient:
         response_model: Type[T],
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         **url_params: Any
     ) -> T:
         """发起POST请求
@@ -223,12 +624,15 @@ class BaseClient:
             response_model: 响应数据模型类
             data: 请求体数据
             params: URL查询参数
+            content: 已序列化的JSON请求体，提供时忽略 data
             **url_params: URL路径参数
             
         Returns:
             解析后的响应数据
         """
-        response = self._make_request('POST', endpoint, params=params, data=data, **url_params)
+        response = self._make_request(
+            'POST', endpoint, params=params, data=data, content=content, **url_params
+        )
         return self._parse_response(response, response_model)
     
     def put(
@@ -237,6 +641,7 @@ class BaseClient:
         response_model: Type[T],
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         **url_params: Any
     ) -> T:
         """发起PUT请求
@@ -246,12 +651,15 @@ class BaseClient:
             response_model: 响应数据模型类
             data: 请求体数据
             params: URL查询参数
+            content: 已序列化的JSON请求体，提供时忽略 data
             **url_params: URL路径参数
             
         Returns:
             解析后的响应数据
         """
-        response = self._make_request('PUT', endpoint, params=params, data=data, **url_params)
+        response = self._make_request(
+            'PUT', endpoint, params=params, data=data, content=content, **url_params
+        )
         return self._parse_response(response, response_model)
     
     def delete(
@@ -275,6 +683,51 @@ class BaseClient:
         response = self._make_request('DELETE', endpoint, params=params, **url_params)
         return self._parse_response(response, response_model)
     
+    async def acall(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """在工作线程中执行同步方法，供 asyncio 代码使用
+        
+        请求仍通过共享的同步HTTP客户端发送，因此连接池、Cookie、缓存和
+        并发限制与同步调用完全一致。多个调用可以通过 asyncio.gather 并发执行：
+        
+            tasks = await asyncio.gather(
+                *(client.acall(client.get_task_by_id, task_id) for task_id in task_ids)
+            )
+        
+        Args:
+            func: 要执行的同步方法，例如 get_task_by_id
+            *args: 位置参数
+            **kwargs: 关键字参数
+            
+        Returns:
+            func 的返回值
+        """
+        return await asyncio.to_thread(func, *args, **kwargs)
+    
+    async def aget(
+        self,
+        endpoint: str,
+        response_model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        cache: bool = True,
+        **url_params: Any
+    ) -> T:
+        """get 的异步版本，参数与 get 相同"""
+        return await self.acall(self.get, endpoint, response_model, params, cache, **url_params)
+    
+    async def apost(
+        self,
+        endpoint: str,
+        response_model: Type[T],
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        **url_params: Any
+    ) -> T:
+        """post 的异步版本，参数与 post 相同"""
+        return await self.acall(
+            self.post, endpoint, response_model, data, params, content, **url_params
+        )
+    
     def get_paginated(
         self,
         base_endpoint: str,
@@ -283,6 +736,7 @@ class BaseClient:
         per_page: int = 20,
         sort_key: str = "id_desc",
         params: Optional[Dict[str, Any]] = None,
+        rec_total: Optional[int] = None,
         **url_params: Any
     ) -> T:
         """发起分页GET请求
@@ -294,48 +748,103 @@ class BaseClient:
             per_page: 每页记录数
             sort_key: 排序键，如 'id_desc'
             params: URL查询参数
+            rec_total: 已知的总记录数。为None时使用此前同一端点发现的值，
+                仍未知时才先请求第一页获取
             **url_params: URL路径参数
             
         Returns:
             解析后的响应数据
         """
-        # 首先获取第一页以获取总记录数
+        rec_total_key = self._rec_total_key(base_endpoint, params, url_params)
+        
         if page == 1:
-            # 直接使用基础API获取第一页
-            first_page_response = self.get(
-                endpoint=f"{base_endpoint}.json",
-                response_model=response_model,
-                params=params,
-                **url_params
+            # 直接使用基础API获取第一页，并记录总记录数供后续翻页使用
+            first_page_response = self._fetch_page(
+                base_endpoint, response_model, 1, per_page, sort_key,
+                params=params, **url_params
             )
+            self._store_rec_total(rec_total_key, self._extract_rec_total(first_page_response))
             return first_page_response
-        else:
-            # 需要先获取总记录数，然后请求指定页面
-            first_page_response = self.get(
-                endpoint=f"{base_endpoint}.json", 
-                response_model=response_model,
-                params=params,
-                **url_params
+        
+        if rec_total is None:
+            rec_total = self._get_rec_total(rec_total_key)
+        if rec_total is None:
+            # 尚不知道总记录数，需要先获取第一页
+            first_page_response = self._fetch_page(
+                base_endpoint, response_model, 1, per_page, sort_key,
+                params=params, **url_params
             )
-            
-            # 从第一页响应中提取分页信息
             rec_total = self._extract_rec_total(first_page_response)
-            
-            # 构建分页URL
-            paginated_endpoint = PaginationHelper.build_paginated_url(
+            self._store_rec_total(rec_total_key, rec_total)
+        
+        return self._fetch_page(
+            base_endpoint, response_model, page, per_page, sort_key,
+            rec_total=rec_total, params=params, **url_params
+        )
+    
+    def _fetch_page(
+        self,
+        base_endpoint: str,
+        response_model: Type[T],
+        page: int,
+        per_page: int,
+        sort_key: str,
+        rec_total: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **url_params: Any
+    ) -> T:
+        """获取单个页面
+        
+        rec_total 未知时请求基础端点（即第一页），
+        已知时直接构建分页URL，不再额外请求第一页。
+        """
+        if rec_total is None:
+            endpoint = f"{base_endpoint}.json"
+        else:
+            endpoint = PaginationHelper.build_paginated_url(
                 base_endpoint=base_endpoint,
                 sort_key=sort_key,
                 rec_total=rec_total,
                 rec_per_page=per_page,
                 page_id=page
             )
-            
-            return self.get(
-                endpoint=paginated_endpoint,
-                response_model=response_model,
-                params=params,
-                **url_params
-            )
+        
+        return self.get(
+            endpoint=endpoint,
+            response_model=response_model,
+            params=params,
+            **url_params
+        )
+    
+    def _rec_total_key(
+        self,
+        base_endpoint: str,
+        params: Optional[Dict[str, Any]],
+        url_params: Dict[str, Any]
+    ) -> Hashable:
+        """构建总记录数缓存键（同一会话中同一端点、同一过滤条件共享总记录数）"""
+        return (
+            base_endpoint,
+            self._session_state.session_id,
+            _freeze_params(params),
+            _freeze_params(url_params),
+        )
+    
+    def _get_rec_total(self, key: Hashable) -> Optional[int]:
+        """读取已知的总记录数，并标记为最近使用"""
+        with self._response_cache_lock:
+            rec_total = self._rec_total_cache.get(key)
+            if rec_total is not None:
+                self._rec_total_cache.move_to_end(key)
+            return rec_total
+    
+    def _store_rec_total(self, key: Hashable, rec_total: int) -> None:
+        """记录总记录数，超出容量时淘汰最久未使用的条目"""
+        with self._response_cache_lock:
+            self._rec_total_cache[key] = rec_total
+            self._rec_total_cache.move_to_end(key)
+            while len(self._rec_total_cache) > REC_TOTAL_CACHE_SIZE:
+                self._rec_total_cache.popitem(last=False)
     
     def get_all_pages(
         self,
@@ -345,10 +854,13 @@ class BaseClient:
         sort_key: str = "id_desc",
         params: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
+        max_workers: int = DEFAULT_PAGE_WORKERS,
         **url_params: Any
     ) -> List[T]:
         """获取所有页面的数据
         
+        第一页用于确定总记录数，其余页面并发获取，结果按页码顺序返回。
+        
         Args:
             base_endpoint: 基础端点
             response_model: 响应数据模型类
@@ -356,52 +868,116 @@ class BaseClient:
             sort_key: 排序键
             params: URL查询参数
             max_pages: 最大页数限制，None表示无限制
+            max_workers: 并发获取剩余页面的最大线程数
             **url_params: URL路径参数
             
         Returns:
             所有页面的响应数据列表
         """
-        results = []
+        return list(self.iter_all_pages(
+            base_endpoint, response_model, per_page=per_page, sort_key=sort_key,
+            params=params, max_pages=max_pages, max_workers=max_workers, **url_params
+        ))
+    
+    def iter_all_pages(
+        self,
+        base_endpoint: str,
+        response_model: Type[T],
+        per_page: int = 20,
+        sort_key: str = "id_desc",
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        max_workers: int = DEFAULT_PAGE_WORKERS,
+        **url_params: Any
+    ) -> Iterator[T]:
+        """逐页迭代所有页面的数据
+        
+        与 get_all_pages 相同地并发获取剩余页面，但按页码顺序逐页产出，
+        已产出的页面不再被持有，调用方可以流式处理大量数据。
         
+        Args:
+            base_endpoint: 基础端点
+            response_model: 响应数据模型类
+            per_page: 每页记录数
+            sort_key: 排序键
+            params: URL查询参数
+            max_pages: 最大页数限制，None表示无限制
+            max_workers: 并发获取剩余页面的最大线程数
+            **url_params: URL路径参数
+            
+        Yields:
+            每一页的响应数据
+        """
         # 获取第一页
-        first_page = self.get_paginated(
-            base_endpoint=base_endpoint,
-            response_model=response_model,
-            page=1,
-            per_page=per_page,
-            sort_key=sort_key,
-            params=params,
-            **url_params
+        first_page = self._fetch_page(
+            base_endpoint, response_model, 1, per_page, sort_key,
+            params=params, **url_params
         )
-        results.append(first_page)
         
-        # 提取分页信息
+        # 提取分页信息，后续页面直接复用，不再重复请求第一页
         rec_total = self._extract_rec_total(first_page)
+        self._store_rec_total(self._rec_total_key(base_endpoint, params, url_params), rec_total)
         total_pages = (rec_total + per_page - 1) // per_page  # 向上取整
         
         # 限制最大页数
         if max_pages:
             total_pages = min(total_pages, max_pages)
         
-        # 获取剩余页面
-        for page in range(2, total_pages + 1):
+        yield first_page
+        del first_page
+        
+        remaining_pages = range(2, total_pages + 1)
+        if not remaining_pages:
+            return
+        
+        def fetch_page(page: int) -> T:
+            return self._fetch_page(
+                base_endpoint, response_model, page, per_page, sort_key,
+                rec_total=rec_total, params=params, **url_params
+            )
+        
+        # 并发获取剩余页面（httpx.Client 是线程安全的，连接池在线程间共享）
+        workers = max(1, min(max_workers, len(remaining_pages)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque((page, executor.submit(fetch_page, page)) for page in remaining_pages)
             try:
-                page_response = self.get_paginated(
-                    base_endpoint=base_endpoint,
-                    response_model=response_model,
-                    page=page,
-                    per_page=per_page,
-                    sort_key=sort_key,
-                    params=params,
-                    **url_params
-                )
-                results.append(page_response)
-            except Exception as e:
-                # 如果某页获取失败，记录错误但继续
-                print(f"获取第{page}页失败: {e}")
-                break
+                while pending:
+                    page, future = pending.popleft()
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # 如果某页获取失败，记录错误并丢弃其后的页面
+                        logger.warning("获取第%d页失败: %s", page, e)
+                        break
+                    yield result
+                    del result
+            finally:
+                # 出错或调用方提前停止迭代时，取消尚未开始的请求
+                for _, future in pending:
+                    future.cancel()
+    
+    def _map_concurrently(
+        self,
+        func: Callable[[Any], R],
+        items: List[Any],
+        max_workers: int = DEFAULT_PAGE_WORKERS
+    ) -> List[R]:
+        """并发地对每一项调用 func，结果按输入顺序返回
+        
+        请求共享同一个连接池（HTTP/2下复用同一连接），任一调用失败时抛出其异常。
         
-        return results
+        Args:
+            func: 对每一项执行的函数，通常会发起一次请求
+            items: 输入项列表
+            max_workers: 最大线程数
+            
+        Returns:
+            与输入顺序一致的结果列表
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+            return list(executor.map(func, items))
     
     def _extract_rec_total(self, response: BaseModel) -> int:
         """从响应中提取总记录数
@@ -412,19 +988,18 @@ class BaseClient:
         Returns:
             总记录数
         """
-        # 尝试不同的方式提取总记录数
         try:
-            # 如果有data属性，尝试解析
-            if hasattr(response, 'data') and response.data:
-                import json
-                if isinstance(response.data, str):
-                    parsed_data = json.loads(response.data)
-                    return parsed_data.get('recTotal', 0)
-                elif isinstance(response.data, dict):
-                    return response.data.get('recTotal', 0)
-                    
-        except Exception as e:
-            print(f"提取总记录数失败: {e}")
+            if isinstance(response, _HasRecTotal):
+                return response.get_rec_total()
             
+            # 其他响应模型：从data字段中读取
+            data = getattr(response, 'data', None)
+            if isinstance(data, str) and data:
+                data = json_loads(data)
+            if isinstance(data, dict):
+                return PaginationHelper.extract_rec_total(data)
+        except Exception as e:
+            logger.warning("提取总记录数失败: %s", e)
+        
         # 默认返回0
         return 0
@@ -4,8 +4,8 @@
 提供缺陷查询、创建、编辑、解决等功能。
 """
 
-from typing import List, Optional
-from .base_client import BaseClient
+from typing import Any, ClassVar, Final, Iterable, Iterator, List, Optional
+from .base_client import BaseClient, DEFAULT_PAGE_WORKERS, requires_session
 from ..models.bug import (
     BugListResponse, BugModel, BugCreateRequest, BugEditRequest,
     BugResolveRequest, BugAssignRequest, BugConfirmRequest, BugDetailResponse,
@@ -13,13 +13,30 @@ from ..models.bug import (
 )
 from ..models.common import CommonOperationResponse
 
+# 缺陷相关API端点模板
+_EP_MY_BUG: Final = 'my-bug'
+_EP_VIEW: Final = 'bug-view-{bug_id}.json'
+_EP_CREATE: Final = 'bug-create-{product_id}-{branch}-moduleID={module_id}-{sessionid}.json'
+_EP_RESOLVE: Final = 'bug-resolve-{bug_id}-{sessionid}.json'
+_EP_CONFIRM: Final = 'bug-confirmBug-{bug_id}-{sessionid}.json'
+_EP_CLOSE: Final = 'bug-close-{bug_id}-{sessionid}.json'
+
+# 缺陷查询结果缓存的有效期（秒），用于合并短时间内对同一缺陷的重复查询
+BUG_CACHE_TTL = 2.0
+
 
 class BugClient(BaseClient):
     """禅道缺陷管理客户端
     
     负责处理缺陷相关的所有操作：查询、创建、编辑、解决、关闭等。
+    缺陷查询结果在 BUG_CACHE_TTL 秒内复用，修改缺陷后自动清除。
     """
     
+    __slots__ = ()
+    
+    response_cache_ttl: ClassVar[Optional[float]] = BUG_CACHE_TTL
+    
+    @requires_session("需要先登录才能获取缺陷列表")
     def get_my_bugs(
         self, 
         status: Optional[str] = None,
@@ -41,15 +58,12 @@ class BugClient(BaseClient):
         Raises:
             ZenTaoError: 获取缺陷列表失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取缺陷列表")
-        
         params = {}
         if status:
             params['status'] = status
         
         response = self.get_paginated(
-            base_endpoint='my-bug',
+            base_endpoint=_EP_MY_BUG,
             response_model=BugListResponse,
             page=page,
             per_page=per_page,
@@ -77,28 +91,44 @@ class BugClient(BaseClient):
         Returns:
             所有缺陷列表
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取缺陷列表")
+        return list(self.iter_my_bugs(
+            status=status, per_page=per_page, sort_key=sort_key, max_pages=max_pages
+        ))
+    
+    @requires_session("需要先登录才能获取缺陷列表")
+    def iter_my_bugs(
+        self, 
+        status: Optional[str] = None,
+        per_page: int = 20,
+        sort_key: str = "id_desc",
+        max_pages: Optional[int] = None
+    ) -> Iterator[BugListItem]:
+        """逐条迭代我的缺陷（所有页面）
+        
+        按页获取并逐条产出，不会同时持有所有页面的数据。
         
+        Args:
+            status: 缺陷状态过滤
+            per_page: 每页记录数
+            sort_key: 排序键
+            max_pages: 最大页数限制
+            
+        Yields:
+            缺陷列表项
+        """
         params = {}
         if status:
             params['status'] = status
         
-        all_responses = self.get_all_pages(
-            base_endpoint='my-bug',
+        for response in self.iter_all_pages(
+            base_endpoint=_EP_MY_BUG,
             response_model=BugListResponse,
             per_page=per_page,
             sort_key=sort_key,
             params=params if params else None,
             max_pages=max_pages
-        )
-        
-        # 合并所有页面的缺陷
-        all_bugs = []
-        for response in all_responses:
-            all_bugs.extend(response.get_bug_list())
-        
-        return all_bugs
+        ):
+            yield from response.get_bug_list()
     
     def get_bug_by_id(self, bug_id: int) -> BugModel:
         """根据缺陷ID获取缺陷详细信息
@@ -114,6 +144,29 @@ class BugClient(BaseClient):
         """
         return self.get_bug_detail(bug_id).get_bug()
     
+    def get_bugs_by_ids(
+        self,
+        bug_ids: Iterable[Any],
+        max_workers: int = DEFAULT_PAGE_WORKERS
+    ) -> List[BugModel]:
+        """批量获取多个缺陷的详细信息
+        
+        重复的ID只查询一次，各缺陷并发获取。
+        
+        Args:
+            bug_ids: 缺陷ID列表
+            max_workers: 并发请求的最大线程数
+            
+        Returns:
+            缺陷详细信息列表，顺序与去重后的输入ID一致
+            
+        Raises:
+            ZenTaoError: 任一缺陷获取失败
+        """
+        keys = list(dict.fromkeys(str(bug_id) for bug_id in bug_ids))
+        return self._map_concurrently(self.get_bug_by_id, keys, max_workers)
+    
+    @requires_session("需要先登录才能获取缺陷详情")
     def get_bug_detail(self, bug_id: int) -> BugDetailResponse:
         """获取指定缺陷完整详情信息
         
@@ -126,11 +179,8 @@ class BugClient(BaseClient):
         Raises:
             ZenTaoError: 获取缺陷详情失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取缺陷详情")
-        
         response = self.get(
-            endpoint='bug-view-{bug_id}.json',
+            endpoint=_EP_VIEW,
             response_model=BugDetailResponse,
             bug_id=str(bug_id)
         )
@@ -156,7 +206,7 @@ class BugClient(BaseClient):
             raise ValueError("需要先登录才能创建缺陷")
         
         response = self.post(
-            endpoint='bug-create-{product_id}-{branch}-moduleID={module_id}-{sessionid}.json',
+            endpoint=_EP_CREATE,
             response_model=CommonOperationResponse,
             data=bug_data.model_dump(exclude_none=True),
             product_id=bug_data.product,
@@ -166,14 +216,14 @@ class BugClient(BaseClient):
         )
         
         # 如果创建成功，获取新创建的缺陷信息
-        if hasattr(response, 'data') and response.data:
-            bug_id = str(response.data.get('id', ''))
-            if bug_id:
-                return self.get_bug_by_id(bug_id)
+        bug_id = str(response.get_data_dict().get('id') or response.id or '')
+        if bug_id:
+            self.clear_cache()
+            return self.get_bug_by_id(bug_id)
         
         # 如果无法获取新缺陷ID，返回基础缺陷信息
         return BugModel(
-            id=response.data.get('id', '0') if response.data else '0',
+            id='0',
             title=bug_data.title,
             product=bug_data.product,
             severity=bug_data.severity,
@@ -204,12 +254,13 @@ class BugClient(BaseClient):
         
         try:
             self.post(
-                endpoint='bug-resolve-{bug_id}-{sessionid}.json',
+                endpoint=_EP_RESOLVE,
                 response_model=CommonOperationResponse,
                 data=resolve_data.model_dump(exclude_none=True),
                 bug_id=str(bug_id),
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
@@ -235,12 +286,13 @@ class BugClient(BaseClient):
         
         try:
             self.post(
-                endpoint='bug-confirmBug-{bug_id}-{sessionid}.json',
+                endpoint=_EP_CONFIRM,
                 response_model=CommonOperationResponse,
                 data=confirm_data.model_dump(exclude_none=True),
                 bug_id=str(bug_id),
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
@@ -270,12 +322,13 @@ class BugClient(BaseClient):
         
         try:
             self.post(
-                endpoint='bug-close-{bug_id}-{sessionid}.json',
+                endpoint=_EP_CLOSE,
                 response_model=CommonOperationResponse,
                 data=data if data else None,
                 bug_id=str(bug_id),
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
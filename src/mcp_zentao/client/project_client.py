@@ -4,21 +4,47 @@
 提供项目查询、创建、编辑等功能。
 """
 
-from typing import List, Optional, Dict, Any
-from .base_client import BaseClient
+import threading
+import time
+from typing import Any, ClassVar, Dict, Final, List, Optional, Tuple
+from .base_client import BaseClient, DEFAULT_PAGE_WORKERS, requires_session
 from ..models.project import (
-    ProjectListResponse, ProjectModel, ProjectCreateRequest, 
-    ProjectEditRequest, ProjectDetailResponse, ProjectTaskResponse, ProjectBugResponse
+    ProjectListResponse, ProjectModel, ProjectCreateRequest,
+    ProjectTaskResponse, ProjectBugResponse
 )
-from ..models.common import CommonOperationResponse
+from ..models.common import CommonOperationResponse, ZenTaoError
+
+# 项目相关API端点模板
+_EP_MY_PROJECT: Final = 'my-project'
+_EP_CREATE: Final = 'project-create-{sessionid}.json'
+_EP_CLOSE: Final = 'project-close-{project_id}-{sessionid}.json'
+_EP_START: Final = 'project-start-{project_id}-{sessionid}.json'
+_EP_TASKS: Final = 'project-task-{project_id}.json'
+_EP_BUGS: Final = 'project-bug-{project_id}.json'
+
+# 项目数据变化不频繁，读取结果缓存的有效期（秒）
+PROJECT_CACHE_TTL = 30.0
 
 
 class ProjectClient(BaseClient):
     """禅道项目管理客户端
     
     负责处理项目相关的所有操作：查询、创建、编辑、删除等。
+    项目查询结果在 PROJECT_CACHE_TTL 秒内复用，修改项目后自动清除。
     """
     
+    __slots__ = ('_project_index', '_project_index_lock')
+    
+    response_cache_ttl: ClassVar[Optional[float]] = PROJECT_CACHE_TTL
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # 项目索引：(会话ID, 项目ID) -> (缓存时间, 项目信息)，由项目列表查询填充。
+        # 子客户端可能被多个线程同时使用，读写索引时需持有锁
+        self._project_index: Dict[Tuple[Optional[str], str], Tuple[float, ProjectModel]] = {}
+        self._project_index_lock = threading.Lock()
+    
+    @requires_session("需要先登录才能获取项目列表")
     def get_my_projects(
         self,
         page: int = 1,
@@ -38,53 +64,106 @@ class ProjectClient(BaseClient):
         Raises:
             ZenTaoError: 获取项目列表失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取项目列表")
-        
         response = self.get_paginated(
-            base_endpoint='my-project',
+            base_endpoint=_EP_MY_PROJECT,
             response_model=ProjectListResponse,
             page=page,
             per_page=per_page,
             sort_key=sort_key
         )
         
-        return response.get_project_list()
+        projects = response.get_project_list()
+        self._index_projects(projects)
+        return projects
     
+    @requires_session("需要先登录才能获取项目列表")
     def get_my_projects_all_pages(
         self,
         per_page: int = 20,
         sort_key: str = "id_desc",
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        max_workers: int = DEFAULT_PAGE_WORKERS
     ) -> List[ProjectModel]:
         """获取我参与的项目列表（所有页面）
         
+        第一页确定总页数后，其余页面并发获取。
+        
         Args:
             per_page: 每页记录数
             sort_key: 排序键
             max_pages: 最大页数限制
+            max_workers: 并发获取页面的最大线程数
             
         Returns:
             所有项目列表
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取项目列表")
-        
-        all_responses = self.get_all_pages(
-            base_endpoint='my-project',
+        # 合并所有页面的项目，逐页处理，不同时持有所有页面的响应
+        all_projects = []
+        for response in self.iter_all_pages(
+            base_endpoint=_EP_MY_PROJECT,
             response_model=ProjectListResponse,
             per_page=per_page,
             sort_key=sort_key,
-            max_pages=max_pages
-        )
-        
-        # 合并所有页面的项目
-        all_projects = []
-        for response in all_responses:
+            max_pages=max_pages,
+            max_workers=max_workers
+        ):
             all_projects.extend(response.get_project_list())
         
+        self._index_projects(all_projects)
         return all_projects
     
+    def get_project_by_id(self, project_id: Any, force_refresh: bool = False) -> ProjectModel:
+        """根据项目ID获取项目信息
+        
+        优先使用当前会话最近一次项目列表查询的结果，未命中或已过期时重新查询我参与的项目列表
+        （列表查询本身在 PROJECT_CACHE_TTL 秒内复用缓存）。
+        
+        Args:
+            project_id: 项目ID
+            force_refresh: 是否忽略缓存，强制重新查询
+            
+        Returns:
+            项目信息
+            
+        Raises:
+            ZenTaoError: 项目不存在或不在我参与的项目中
+        """
+        key = (self.session_id, str(project_id))
+        if not force_refresh:
+            cached = self._get_indexed_project(key)
+            if cached is not None and time.monotonic() - cached[0] < PROJECT_CACHE_TTL:
+                return cached[1]
+        
+        if force_refresh:
+            self.clear_cache(_EP_MY_PROJECT)
+        self.get_my_projects_all_pages()
+        cached = self._get_indexed_project(key)
+        if cached is None:
+            raise ZenTaoError(status="failed", message=f"未找到项目: {key[1]}")
+        return cached[1]
+    
+    def _get_indexed_project(self, key: Tuple[Optional[str], str]) -> Optional[Tuple[float, ProjectModel]]:
+        """读取项目索引条目"""
+        with self._project_index_lock:
+            return self._project_index.get(key)
+    
+    def _index_projects(self, projects: List[ProjectModel]) -> None:
+        """将项目列表中的项目按ID记入当前会话的索引，并丢弃其他会话的条目"""
+        session_id = self.session_id
+        now = time.monotonic()
+        with self._project_index_lock:
+            index = self._project_index
+            for key in [key for key in index if key[0] != session_id]:
+                del index[key]
+            for project in projects:
+                index[(session_id, str(project.id))] = (now, project)
+    
+    def clear_cache(self, endpoint_prefix: Optional[str] = None) -> None:
+        """清除响应缓存，同时清除项目索引"""
+        super().clear_cache(endpoint_prefix)
+        with self._project_index_lock:
+            self._project_index.clear()
+    
     def create_project(self, project_data: ProjectCreateRequest) -> ProjectModel:
         """创建新项目
         
@@ -104,21 +183,22 @@ class ProjectClient(BaseClient):
             raise ValueError("需要先登录才能创建项目")
         
         response = self.post(
-            endpoint='project-create-{sessionid}.json',
+            endpoint=_EP_CREATE,
             response_model=CommonOperationResponse,
             data=project_data.model_dump(exclude_none=True),
             sessionid=self.session_id
         )
         
+        self.clear_cache()
+        
         # 如果创建成功，获取新创建的项目信息
-        if hasattr(response, 'data') and response.data:
-            project_id = str(response.data.get('id', ''))
-            if project_id:
-                return self.get_project_by_id(project_id)
+        project_id = str(response.get_data_dict().get('id') or response.id or '')
+        if project_id:
+            return self.get_project_by_id(project_id)
         
         # 如果无法获取新项目ID，返回基础项目信息
         return ProjectModel(
-            id=response.data.get('id', '0') if response.data else '0',
+            id='0',
             name=project_data.name,
             code=project_data.code or '',
             type=project_data.type,
@@ -152,12 +232,13 @@ class ProjectClient(BaseClient):
         
         try:
             self.post(
-                endpoint='project-close-{project_id}-{sessionid}.json',
+                endpoint=_EP_CLOSE,
                 response_model=CommonOperationResponse,
                 data=data if data else None,
                 project_id=project_id,
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
@@ -182,15 +263,17 @@ class ProjectClient(BaseClient):
         
         try:
             self.post(
-                endpoint='project-start-{project_id}-{sessionid}.json',
+                endpoint=_EP_START,
                 response_model=CommonOperationResponse,
                 project_id=project_id,
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
     
+    @requires_session("需要先登录才能获取项目任务")
     def get_project_tasks(self, project_id: int) -> ProjectTaskResponse:
         """获取项目相关的任务列表
         
@@ -203,17 +286,35 @@ class ProjectClient(BaseClient):
         Raises:
             ZenTaoError: 获取项目任务失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取项目任务")
-        
         response = self.get(
-            endpoint='project-task-{project_id}.json',
+            endpoint=_EP_TASKS,
             response_model=ProjectTaskResponse,
             project_id=str(project_id)
         )
         
         return response
 
+    @requires_session("需要先登录才能获取项目任务")
+    def get_many_project_tasks(
+        self,
+        project_ids: List[int],
+        max_workers: int = DEFAULT_PAGE_WORKERS
+    ) -> List[ProjectTaskResponse]:
+        """并发获取多个项目的任务列表
+        
+        Args:
+            project_ids: 项目ID列表
+            max_workers: 并发请求的最大线程数
+            
+        Returns:
+            各项目的任务列表，顺序与输入ID一致
+            
+        Raises:
+            ZenTaoError: 任一项目的任务获取失败
+        """
+        return self._map_concurrently(self.get_project_tasks, list(project_ids), max_workers)
+
+    @requires_session("需要先登录才能获取项目缺陷")
     def get_project_bugs(self, project_id: int) -> ProjectBugResponse:
         """获取项目相关的缺陷列表
         
@@ -226,11 +327,8 @@ class ProjectClient(BaseClient):
         Raises:
             ZenTaoError: 获取项目缺陷失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取项目缺陷")
-        
         response = self.get(
-            endpoint='project-bug-{project_id}.json',
+            endpoint=_EP_BUGS,
             response_model=ProjectBugResponse,
             project_id=str(project_id)
         )
@@ -4,10 +4,15 @@
 提供会话ID获取、用户登录/登出等功能。
 """
 
-from typing import Optional
+from typing import Final
 from .base_client import BaseClient
 from ..models.session import SessionResponse, LoginRequest, LoginResponse, LogoutResponse
-from ..models.user import UserDetailResponse
+from ..models.user import UserDetailResponse, UserModel
+
+# 会话相关API端点模板
+_EP_SESSION_ID: Final = 'api-getSessionID.json'
+_EP_LOGIN: Final = 'user-login-{sessionid}.json'
+_EP_LOGOUT: Final = 'user-logout-{sessionid}.json'
 
 
 class SessionClient(BaseClient):
@@ -16,6 +21,8 @@ class SessionClient(BaseClient):
     负责处理会话ID获取、用户认证等会话相关操作。
     """
     
+    __slots__ = ()
+    
     def get_session_id(self) -> str:
         """获取会话ID
         
@@ -26,8 +33,9 @@ class SessionClient(BaseClient):
             ZenTaoError: 获取会话ID失败
         """
         response = self.get(
-            endpoint='api-getSessionID.json',
-            response_model=SessionResponse
+            endpoint=_EP_SESSION_ID,
+            response_model=SessionResponse,
+            cache=False
         )
         
         # 提取并存储会话ID
@@ -49,7 +57,8 @@ class SessionClient(BaseClient):
         Raises:
             ZenTaoError: 登录失败
         """
-        # 确保有会话ID
+        # 确保有会话ID。会话ID只在本客户端（及共享同一会话状态的子客户端）内复用，
+        # 登录失败时不重试，避免错误密码被重复提交而触发禅道的账号锁定
         if not self.session_id:
             self.get_session_id()
         
@@ -61,21 +70,20 @@ class SessionClient(BaseClient):
         
         # 发起登录请求
         response = self.get(
-            endpoint='user-login-{sessionid}.json',
+            endpoint=_EP_LOGIN,
             response_model=LoginResponse,
             params=login_request.model_dump(),
+            cache=False,
             sessionid=self.session_id
         )
         
         # 从LoginResponse中提取用户信息并转换为UserModel
         user_data = response.user
-        from ..models.user import UserModel
         
         # 将用户字典转换为UserModel
         user_model = UserModel.model_validate(user_data)
         
         # 返回包装的UserDetailResponse
-        from ..models.user import UserDetailResponse
         return UserDetailResponse(
             status="success",
             user=user_model
@@ -96,8 +104,9 @@ class SessionClient(BaseClient):
         try:
             # 发起登出请求
             response = self.get(
-                endpoint='user-logout-{sessionid}.json',
+                endpoint=_EP_LOGOUT,
                 response_model=LogoutResponse,
+                cache=False,
                 sessionid=self.session_id
             )
             
@@ -4,21 +4,38 @@
 提供任务查询、创建、编辑、状态变更等功能。
 """
 
-from typing import List, Optional, Dict, Any
-from .base_client import BaseClient
+from typing import ClassVar, Final, List, Optional, Dict, Any
+from .base_client import BaseClient, DEFAULT_PAGE_WORKERS, requires_session
 from ..models.task import (
     TaskListResponse, TaskModel, TaskCreateRequest, TaskEditRequest,
     TaskFinishRequest, TaskAssignRequest, TaskDetailResponse
 )
 from ..models.common import CommonOperationResponse
 
+# 任务相关API端点模板
+_EP_MY_TASK: Final = 'my-task'
+_EP_VIEW: Final = 'task-view-{task_id}.json'
+_EP_CREATE: Final = 'task-create-{project_id}--{module_id}-{sessionid}.json'
+_EP_START: Final = 'task-start-{task_id}-{sessionid}.json'
+_EP_FINISH: Final = 'task-finish-{task_id}-{sessionid}.json'
+_EP_CLOSE: Final = 'task-close-{task_id}-{sessionid}.json'
+
+# 任务查询结果缓存的有效期（秒），用于合并短时间内的重复查询（如界面刷新）
+TASK_CACHE_TTL = 10.0
+
 
 class TaskClient(BaseClient):
     """禅道任务管理客户端
     
     负责处理任务相关的所有操作：查询、创建、编辑、分配、完成等。
+    任务查询结果在 TASK_CACHE_TTL 秒内复用，修改任务后自动清除。
     """
     
+    __slots__ = ()
+    
+    response_cache_ttl: ClassVar[Optional[float]] = TASK_CACHE_TTL
+    
+    @requires_session("需要先登录才能获取任务列表")
     def get_my_tasks(
         self, 
         status: Optional[str] = None,
@@ -40,15 +57,12 @@ class TaskClient(BaseClient):
         Raises:
             ZenTaoError: 获取任务列表失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取任务列表")
-        
         params = {}
         if status:
             params['status'] = status
         
         response = self.get_paginated(
-            base_endpoint='my-task',
+            base_endpoint=_EP_MY_TASK,
             response_model=TaskListResponse,
             page=page,
             per_page=per_page,
@@ -58,43 +72,44 @@ class TaskClient(BaseClient):
         
         return response.get_task_list()
     
+    @requires_session("需要先登录才能获取任务列表")
     def get_my_tasks_all_pages(
         self, 
         status: Optional[str] = None,
         per_page: int = 20,
         sort_key: str = "id_desc",
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        max_workers: int = DEFAULT_PAGE_WORKERS
     ) -> List[TaskModel]:
         """获取我的任务列表（所有页面）
         
+        第一页确定总页数后，其余页面并发获取。
+        
         Args:
             status: 任务状态过滤
             per_page: 每页记录数
             sort_key: 排序键
             max_pages: 最大页数限制
+            max_workers: 并发获取页面的最大线程数
             
         Returns:
             所有任务列表
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取任务列表")
-        
         params = {}
         if status:
             params['status'] = status
         
-        all_responses = self.get_all_pages(
-            base_endpoint='my-task',
+        # 合并所有页面的任务，逐页处理，不同时持有所有页面的响应
+        all_tasks = []
+        for response in self.iter_all_pages(
+            base_endpoint=_EP_MY_TASK,
             response_model=TaskListResponse,
             per_page=per_page,
             sort_key=sort_key,
             params=params if params else None,
-            max_pages=max_pages
-        )
-        
-        # 合并所有页面的任务
-        all_tasks = []
-        for response in all_responses:
+            max_pages=max_pages,
+            max_workers=max_workers
+        ):
             all_tasks.extend(response.get_task_list())
         
         return all_tasks
@@ -113,6 +128,7 @@ class TaskClient(BaseClient):
         """
         return self.get_task_detail(task_id).get_task()
     
+    @requires_session("需要先登录才能获取任务详情")
     def get_task_detail(self, task_id: int) -> TaskDetailResponse:
         """获取指定任务的完整详细信息
         
@@ -125,11 +141,8 @@ class TaskClient(BaseClient):
         Raises:
             ZenTaoError: 获取任务详细失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取任务详情")
-        
         response = self.get(
-            endpoint='task-view-{task_id}.json',
+            endpoint=_EP_VIEW,
             response_model=TaskDetailResponse,
             task_id=str(task_id)
         )
@@ -155,7 +168,7 @@ class TaskClient(BaseClient):
             raise ValueError("需要先登录才能创建任务")
         
         response = self.post(
-            endpoint='task-create-{project_id}--{module_id}-{sessionid}.json',
+            endpoint=_EP_CREATE,
             response_model=CommonOperationResponse,
             data=task_data.model_dump(exclude_none=True),
             project_id=task_data.project,
@@ -163,15 +176,16 @@ class TaskClient(BaseClient):
             sessionid=self.session_id
         )
         
+        self.clear_cache()
+        
         # 如果创建成功，获取新创建的任务信息
-        if hasattr(response, 'data') and response.data:
-            task_id = response.data.get('id', 0)
-            if task_id:
-                return self.get_task_by_id(int(task_id))
+        task_id = response.get_data_dict().get('id') or response.id
+        if task_id:
+            return self.get_task_by_id(int(task_id))
         
         # 如果无法获取新任务ID，返回基础任务信息
         return TaskModel(
-            id=response.data.get('id', '0') if response.data else '0',
+            id='0',
             name=task_data.name,
             project=task_data.project,
             type=task_data.type,
@@ -200,11 +214,12 @@ class TaskClient(BaseClient):
         
         try:
             self.post(
-                endpoint='task-start-{task_id}-{sessionid}.json',
+                endpoint=_EP_START,
                 response_model=CommonOperationResponse,
                 task_id=str(task_id),
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
@@ -230,12 +245,13 @@ class TaskClient(BaseClient):
         
         try:
             self.post(
-                endpoint='task-finish-{task_id}-{sessionid}.json',
+                endpoint=_EP_FINISH,
                 response_model=CommonOperationResponse,
                 data=finish_data.model_dump(exclude_none=True),
                 task_id=str(task_id),
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
@@ -265,12 +281,13 @@ class TaskClient(BaseClient):
         
         try:
             self.post(
-                endpoint='task-close-{task_id}-{sessionid}.json',
+                endpoint=_EP_CLOSE,
                 response_model=CommonOperationResponse,
                 data=data if data else None,
                 task_id=str(task_id),
                 sessionid=self.session_id
             )
+            self.clear_cache()
             return True
         except Exception:
             return False
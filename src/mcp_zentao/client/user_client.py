@@ -4,17 +4,30 @@
 提供用户信息查询等功能。
 """
 
-from typing import List, Optional, Dict, Any
-from .base_client import BaseClient
+from typing import ClassVar, Final, List, Optional, Dict, Any
+from .base_client import BaseClient, requires_session
 from ..models.user import UserDetailResponse, UserListResponse, UserModel
 
+# 用户相关API端点模板
+_EP_CURRENT_USER: Final = 'user-login-{sessionid}.json'
+_EP_COMPANY_BROWSE: Final = 'company-browse-{dept_id}.json'
+
+# 用户信息很少变化，查询结果缓存的有效期（秒）
+USER_CACHE_TTL = 60.0
+
 
 class UserClient(BaseClient):
     """禅道用户管理客户端
     
     负责处理用户信息查询、用户列表获取等用户相关操作。
+    用户查询结果在 USER_CACHE_TTL 秒内复用。
     """
     
+    __slots__ = ()
+    
+    response_cache_ttl: ClassVar[Optional[float]] = USER_CACHE_TTL
+    
+    @requires_session("需要先登录才能获取用户信息")
     def get_current_user(self) -> UserModel:
         """获取当前登录用户的详细信息
         
@@ -24,17 +37,15 @@ class UserClient(BaseClient):
         Raises:
             ZenTaoError: 获取用户信息失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取用户信息")
-        
         response = self.get(
-            endpoint='user-login-{sessionid}.json',
+            endpoint=_EP_CURRENT_USER,
             response_model=UserDetailResponse,
             sessionid=self.session_id
         )
         
         return response.get_user_data()
     
+    @requires_session("需要先登录才能获取用户列表")
     def get_users(self, dept_id: Optional[int] = 0) -> List[Dict[str, Any]]:
         """获取用户列表
         
@@ -47,11 +58,8 @@ class UserClient(BaseClient):
         Raises:
             ZenTaoError: 获取用户列表失败
         """
-        if not self.session_id:
-            raise ValueError("需要先登录才能获取用户列表")
-        
         response = self.get(
-            endpoint='company-browse-{dept_id}.json',
+            endpoint=_EP_COMPANY_BROWSE,
             response_model=UserListResponse,
             dept_id=str(dept_id)  # API需要字符串格式的dept_id
         )
@@ -5,15 +5,33 @@
 统一管理HTTP会话和Cookie，确保登录状态在所有子客户端间共享。
 """
 
+import asyncio
+import importlib
+import threading
+import warnings
+from typing import TYPE_CHECKING, Any, Dict, Final, List, Mapping, Optional, Tuple
 import httpx
-from typing import Optional
-from .base_client import BaseClient
-from .session_client import SessionClient
-from .user_client import UserClient
-from .project_client import ProjectClient
-from .task_client import TaskClient
-from .bug_client import BugClient
-from ..models.user import UserModel
+from .base_client import (
+    BaseClient, DEFAULT_HTTP_LIMITS, DEFAULT_MAX_CONCURRENCY, SessionState, create_http_client
+)
+
+if TYPE_CHECKING:
+    # 子客户端及其数据模型在首次访问对应属性时才导入，缩短冷启动时间
+    from .session_client import SessionClient
+    from .user_client import UserClient
+    from .project_client import ProjectClient
+    from .task_client import TaskClient
+    from .bug_client import BugClient
+    from ..models.user import UserModel
+
+# 子客户端属性名 -> (模块名, 类名)，首次访问属性时导入并创建
+_SUB_CLIENT_CLASSES: Final[Mapping[str, Tuple[str, str]]] = {
+    'sessions': ('.session_client', 'SessionClient'),
+    'users': ('.user_client', 'UserClient'),
+    'projects': ('.project_client', 'ProjectClient'),
+    'tasks': ('.task_client', 'TaskClient'),
+    'bugs': ('.bug_client', 'BugClient'),
+}
 
 
 class ZenTaoClient:
@@ -46,44 +64,73 @@ class ZenTaoClient:
         with ZenTaoClient("http://zentao.example.com") as client:
             user = client.login("username", "password")
             projects = client.get_my_projects()
+    
+    在 asyncio 代码中并发调用:
+        async with ZenTaoClient("http://zentao.example.com") as client:
+            await client.sessions.acall(client.login, "username", "password")
+            tasks = await asyncio.gather(
+                *(client.tasks.acall(client.tasks.get_task_by_id, i) for i in task_ids)
+            )
     """
     
-    def __init__(self, base_url: str, timeout: float = 30.0) -> None:
+    __slots__ = (
+        'base_url', 'timeout', '_owns_http_client', '_closed', '_http_client', '_session_state',
+        '_client_kwargs', '_sub_clients_lock', '_current_user',
+        # 各模块客户端，首次访问时由 __getattr__ 创建并写入槽位，之后为普通属性读取
+        'sessions', 'users', 'projects', 'tasks', 'bugs',
+    )
+    
+    sessions: 'SessionClient'   # 会话管理客户端
+    users: 'UserClient'         # 用户管理客户端
+    projects: 'ProjectClient'   # 项目管理客户端
+    tasks: 'TaskClient'         # 任务管理客户端
+    bugs: 'BugClient'           # 缺陷管理客户端
+    
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30.0,
+        http_client: Optional[httpx.Client] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        limits: httpx.Limits = DEFAULT_HTTP_LIMITS
+    ) -> None:
         """初始化禅道客户端
         
         Args:
             base_url: 禅道系统的基础URL，例如 http://zentao.example.com
             timeout: 请求超时时间，默认30秒
+            http_client: 共享的HTTP客户端。传入时所有子客户端复用它，
+                且不会在 close() 时关闭它；为None时自行创建
+            max_concurrency: 所有子客户端合计同时进行中的最大请求数，
+                并发获取分页或批量操作时避免压垮禅道服务器
+            limits: 自行创建HTTP客户端时的连接池配置，传入 http_client 时忽略
         """
         self.base_url = base_url
         self.timeout = timeout
+        self._owns_http_client = http_client is None
+        self._closed = False
         
-        # 创建共享的HTTP客户端，用于管理Cookie
-        self._http_client = httpx.Client(
-            timeout=timeout,
-            follow_redirects=True
-        )
-        
-        # 创建各个功能模块的客户端，使用共享的HTTP客户端
-        self._session_client = SessionClient(base_url, timeout)
-        self._user_client = UserClient(base_url, timeout)
-        self._project_client = ProjectClient(base_url, timeout)
-        self._task_client = TaskClient(base_url, timeout)
-        self._bug_client = BugClient(base_url, timeout)
+        # 创建共享的HTTP客户端，用于管理Cookie并复用连接。
+        # 禅道API接口不会重定向，不跟随重定向，会话过期被跳转到登录页时直接报错
+        if http_client is None:
+            http_client = create_http_client(
+                timeout,
+                limits=limits,
+                headers=BaseClient._DEFAULT_HEADERS
+            )
+        self._http_client = http_client
         
-        # 让所有客户端共享HTTP会话
-        self._sync_http_clients()
+        # 各个功能模块的客户端在首次访问时创建，所有客户端共享同一个HTTP客户端、
+        # 会话状态和并发请求限制，登录/登出后会话ID对所有子客户端立即生效
+        self._session_state = SessionState()
+        self._client_kwargs: Dict[str, Any] = {
+            'client': self._http_client,
+            'session_state': self._session_state,
+            'request_slots': threading.BoundedSemaphore(max_concurrency),
+        }
+        self._sub_clients_lock = threading.Lock()
         
-        self._current_user: Optional[UserModel] = None
-    
-    def _sync_http_clients(self) -> None:
-        """同步所有客户端的HTTP会话，确保Cookie一致性"""
-        # 所有客户端使用同一个HTTP客户端实例，确保Cookie共享
-        self._session_client._client = self._http_client
-        self._user_client._client = self._http_client
-        self._project_client._client = self._http_client
-        self._task_client._client = self._http_client
-        self._bug_client._client = self._http_client
+        self._current_user: Optional['UserModel'] = None
     
     def __enter__(self) -> 'ZenTaoClient':
         """上下文管理器进入"""
@@ -93,12 +140,41 @@ class ZenTaoClient:
         """上下文管理器退出"""
         self.close()
     
+    async def __aenter__(self) -> 'ZenTaoClient':
+        """异步上下文管理器进入，配合子客户端的 acall/aget/apost 使用"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """异步上下文管理器退出"""
+        await asyncio.to_thread(self.close)
+    
     def close(self) -> None:
-        """关闭HTTP客户端连接"""
+        """关闭HTTP客户端连接（外部传入的HTTP客户端由其创建者负责关闭）
+        
+        重复调用是安全的，只有第一次调用会关闭连接池。
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not self._owns_http_client:
+            return
         try:
             self._http_client.close()
-        except Exception:
-            pass  # 忽略关闭时的错误
+        except httpx.HTTPError:
+            pass  # 忽略关闭连接时的网络错误
+    
+    def __del__(self) -> None:
+        """未关闭就被回收时发出警告，并归还连接池中的连接"""
+        # __init__ 未完成时属性可能尚未设置
+        if getattr(self, '_closed', True) or not self._owns_http_client:
+            return
+        warnings.warn(
+            f"未关闭的 ZenTaoClient({self.base_url!r})，请调用 close() 或使用上下文管理器",
+            ResourceWarning,
+            source=self
+        )
+        self.close()
+    
     @property
     def session_id(self) -> Optional[str]:
         """获取当前会话ID
@@ -106,10 +182,10 @@ class ZenTaoClient:
         注意：使用Cookie管理时，session_id主要用于URL构建，
         实际认证依赖HTTP客户端中的zentaosid Cookie
         """
-        return self._session_client.session_id
+        return self._session_state.session_id
     
     @property
-    def current_user(self) -> Optional[UserModel]:
+    def current_user(self) -> Optional['UserModel']:
         """获取当前登录用户信息"""
         return self._current_user
     
@@ -119,19 +195,21 @@ class ZenTaoClient:
         
         检查HTTP客户端是否有有效的zentaosid Cookie
         """
-        # 检查是否有zentaosid Cookie
-        for cookie in self._http_client.cookies.jar:
-            if cookie.name == 'zentaosid' and cookie.value:
-                return True
-        return False
+        return bool(self.zentao_cookie)
     
     @property 
     def zentao_cookie(self) -> Optional[str]:
         """获取当前的zentaosid Cookie值"""
-        for cookie in self._http_client.cookies.jar:
-            if cookie.name == 'zentaosid':
-                return cookie.value
-        return None
+        cookies = self._http_client.cookies
+        try:
+            return cookies.get('zentaosid')
+        except httpx.CookieConflict:
+            # 多个域或路径下存在同名Cookie时，取第一个有值的
+            return next(
+                (cookie.value for cookie in cookies.jar
+                 if cookie.name == 'zentaosid' and cookie.value),
+                None
+            )
     
     # 会话管理方法
     def get_session_id(self) -> str:
@@ -141,23 +219,12 @@ class ZenTaoClient:
             会话ID字符串
             
         Note:
-            获取session_id后会自动设置到所有子客户端，
+            所有子客户端共享同一个会话状态，获取后立即对所有子客户端生效，
             但实际认证主要依赖共享的HTTP客户端中的Cookie
         """
-        session_id = self._session_client.get_session_id()
-        self._sync_session_id_to_clients()
-        return session_id
-    
-    def _sync_session_id_to_clients(self) -> None:
-        """同步会话ID到所有子客户端（用于URL构建）"""
-        session_id = self._session_client.session_id
-        
-        self._user_client.session_id = session_id
-        self._project_client.session_id = session_id
-        self._task_client.session_id = session_id
-        self._bug_client.session_id = session_id
+        return self.sessions.get_session_id()
     
-    def login(self, username: str, password: str) -> UserModel:
+    def login(self, username: str, password: str) -> 'UserModel':
         """用户登录
         
         Args:
@@ -174,8 +241,7 @@ class ZenTaoClient:
             登录成功后，zentaosid Cookie会自动保存在共享的HTTP客户端中，
             后续所有API调用都会自动携带此Cookie进行认证
         """
-        user_response = self._session_client.login(username, password)
-        self._sync_session_id_to_clients()
+        user_response = self.sessions.login(username, password)
         
         # 提取用户信息
         self._current_user = user_response.user
@@ -191,8 +257,7 @@ class ZenTaoClient:
         Note:
             登出后会清除共享HTTP客户端中的所有Cookie
         """
-        result = self._session_client.logout()
-        self._sync_session_id_to_clients()
+        result = self.sessions.logout()
         self._current_user = None
         
         # 清除所有Cookie
@@ -200,31 +265,26 @@ class ZenTaoClient:
         
         return result
     
-    # 各模块客户端的访问属性
-    @property
-    def sessions(self) -> SessionClient:
-        """会话管理客户端"""
-        return self._session_client
-    
-    @property
-    def users(self) -> UserClient:
-        """用户管理客户端"""
-        return self._user_client
-    
-    @property
-    def projects(self) -> ProjectClient:
-        """项目管理客户端"""
-        return self._project_client
-    
-    @property
-    def tasks(self) -> TaskClient:
-        """任务管理客户端"""
-        return self._task_client
-    
-    @property
-    def bugs(self) -> BugClient:
-        """缺陷管理客户端"""
-        return self._bug_client
+    def __getattr__(self, name: str) -> Any:
+        """首次访问子客户端属性时创建对应的子客户端
+        
+        只有槽位尚未赋值时才会调用到这里，创建后的子客户端直接写入槽位，
+        之后的访问不再经过此方法。
+        """
+        spec = _SUB_CLIENT_CLASSES.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        with self._sub_clients_lock:
+            try:
+                # 等待锁期间其他线程可能已经创建
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+            module_name, class_name = spec
+            client_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            sub_client = client_class(self.base_url, self.timeout, **self._client_kwargs)
+            object.__setattr__(self, name, sub_client)
+            return sub_client
     
     # 便捷方法，提供常用操作的快速访问
     def get_my_projects(self):
@@ -247,6 +307,29 @@ class ZenTaoClient:
         """根据ID获取缺陷信息（便捷方法）"""
         return self.bugs.get_bug_by_id(bug_id)
     
+    def get_bugs_by_ids(self, bug_ids):
+        """根据ID批量获取缺陷信息（便捷方法）"""
+        return self.bugs.get_bugs_by_ids(bug_ids)
+    
+    async def aget_my_dashboard(self) -> Dict[str, List[Any]]:
+        """并发获取我的项目、任务和缺陷（第一页）
+        
+        三个查询互不依赖，同时发出并共享连接池，总耗时约为最慢的一个查询。
+        
+        Returns:
+            {'projects': 项目列表, 'tasks': 任务列表, 'bugs': 缺陷列表}
+            
+        Raises:
+            ValueError: 未登录
+            ZenTaoError: 任一查询失败
+        """
+        projects, tasks, bugs = await asyncio.gather(
+            self.projects.acall(self.projects.get_my_projects),
+            self.tasks.acall(self.tasks.get_my_tasks),
+            self.bugs.acall(self.bugs.get_my_bugs),
+        )
+        return {'projects': projects, 'tasks': tasks, 'bugs': bugs}
+    
     def ensure_logged_in(self) -> None:
         """确保已登录，如果未登录则抛出异常
         
@@ -256,7 +339,7 @@ class ZenTaoClient:
         if not self.is_logged_in:
             raise ValueError("需要先登录才能执行此操作")
     
-    def refresh_current_user(self) -> UserModel:
+    def refresh_current_user(self) -> 'UserModel':
         """刷新当前用户信息
         
         Returns:
@@ -266,5 +349,7 @@ class ZenTaoClient:
             ZenTaoError: 刷新失败
         """
         self.ensure_logged_in()
+        # 跳过用户信息缓存，确保获取的是最新数据
+        self.users.clear_cache('user-login')
         self._current_user = self.users.get_current_user()
         return self._current_user
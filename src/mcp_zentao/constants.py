@@ -3,34 +3,36 @@
 集中管理禅道 MCP 服务器的常量配置，避免硬编码分散
 """
 
-from typing import Dict, Any
+import sys
+from types import MappingProxyType
+from typing import Mapping
 
 # ===============================
-# 排序键映射配置
+# 排序键映射配置（只读）
 # ===============================
 
 # 缺陷排序映射
-BUG_SORT_KEY_MAPPING: Dict[str, str] = {
+BUG_SORT_KEY_MAPPING: Mapping[str, str] = MappingProxyType({
     "latest": "id_desc",
     "oldest": "id_asc",
     "priority": "pri_asc",
     "severity": "severity_desc",
-}
+})
 
 # 任务排序映射  
-TASK_SORT_KEY_MAPPING: Dict[str, str] = {
+TASK_SORT_KEY_MAPPING: Mapping[str, str] = MappingProxyType({
     "latest": "id_desc",
     "oldest": "id_asc",
     "deadline": "deadline_desc",
     "status": "status_asc",
-}
+})
 
 # 项目排序映射
-PROJECT_SORT_KEY_MAPPING: Dict[str, str] = {
+PROJECT_SORT_KEY_MAPPING: Mapping[str, str] = MappingProxyType({
     "latest": "id_desc",
     "oldest": "id_asc",
     "end": "end_desc",
-}
+})
 
 # ===============================
 # 分页配置
@@ -51,6 +53,15 @@ MAX_HISTORY_RECORDS = 10
 # 文件下载链接模板
 FILE_DOWNLOAD_URL_TEMPLATE = "{base_url}file-download-{file_id}.html?zentaosid={session_id}"
 
+
+def make_download_url(base_url: str, file_id: str, session_id: str) -> str:
+    """生成文件下载链接，与 FILE_DOWNLOAD_URL_TEMPLATE 格式一致
+
+    批量生成链接时可用 functools.partial 预先绑定 base_url。
+    """
+    return f"{base_url}file-download-{file_id}.html?zentaosid={session_id}"
+
+
 # ===============================
 # 默认值配置
 # ===============================
@@ -65,6 +76,7 @@ DEFAULT_TIMEOUT = 30.0
 # 状态文本分隔符
 # ===============================
 
-SECTION_SEPARATOR = "=" * 60
-SUBSECTION_SEPARATOR = "-" * 40
-ITEM_SEPARATOR = "─" * 50
+# 分隔符在导入时构造一次并驻留，拼接进文本或作为字典键时复用同一个对象
+SECTION_SEPARATOR = sys.intern("=" * 60)
+SUBSECTION_SEPARATOR = sys.intern("-" * 40)
+ITEM_SEPARATOR = sys.intern("─" * 50)
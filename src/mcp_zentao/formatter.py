@@ -6,8 +6,46 @@
 """
 
 import re
+from html.parser import HTMLParser
 from typing import Any
 
+# 连续三个及以上的换行，折叠为一个空行
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# 单独的回车视为换行，不间断空格按普通空格输出，一次 translate 完成
+_CHAR_TRANSLATION = str.maketrans({"\r": "\n", "\xa0": " "})
+
+
+class _MarkdownBuilder(HTMLParser):
+    """逐个标签地将 HTML 转换为 Markdown，输出片段累积在列表中
+
+    图片转换为 Markdown 图片（相对路径拼接为绝对路径），段落和换行转换为换行，
+    其他标签移除，文本与实体（由 HTMLParser 解码）原样保留。
+    """
+
+    def __init__(self, base: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base = base
+        self.parts: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "img":
+            attributes = dict(attrs)
+            src = attributes.get("src")
+            if src:
+                if src.startswith("/"):
+                    src = self.base + src
+                self.parts.append(f"![{attributes.get('alt') or 'image'}]({src})")
+        elif tag in ("p", "br"):
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "p":
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        self.parts.append(data)
+
 
 def convert_html_to_markdown(html: str | None, base_url: str) -> str:
     """将 HTML 内容转换为 Markdown 格式
@@ -22,56 +60,13 @@ def convert_html_to_markdown(html: str | None, base_url: str) -> str:
     if not html:
         return ""
 
-    base = base_url.rstrip("/")
-    result = html
-
-    # 1. 处理图片标签 -> Markdown 图片
-    def replace_img(match: re.Match[str]) -> str:
-        # 提取 src 和 alt 属性
-        tag = match.group(0)
-        src_match = re.search(r'src=["\']([^"\']+)["\']', tag)
-        alt_match = re.search(r'alt=["\']([^"\']*)["\']', tag)
-
-        if not src_match:
-            return ""
-
-        src = src_match.group(1)
-        alt = alt_match.group(1) if alt_match else "image"
-
-        # 相对路径转绝对路径
-        if src.startswith("/"):
-            src = f"{base}{src}"
-
-        return f"![{alt or 'image'}]({src})"
-
-    result = re.sub(r"<img[^>]*>", replace_img, result, flags=re.IGNORECASE)
-
-    # 2. 处理段落标签
-    result = re.sub(r"<p[^>]*>", "\n", result)
-    result = result.replace("</p>", "\n")
-
-    # 3. 处理换行标签
-    result = result.replace("<br />", "\n").replace("<br>", "\n")
-
-    # 4. 处理 span 标签（移除）
-    result = re.sub(r"<span[^>]*>", "", result)
-    result = result.replace("</span>", "")
-
-    # 5. 移除其他 HTML 标签
-    result = re.sub(r"<[^>]+>", "", result)
-
-    # 6. 处理 HTML 实体
-    result = (
-        result.replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&amp;", "&")
-        .replace("&nbsp;", " ")
-        .replace("&quot;", '"')
-    )
+    builder = _MarkdownBuilder(base_url.rstrip("/"))
+    builder.feed(html)
+    builder.close()
 
-    # 7. 清理多余空行
-    result = re.sub(r"\n{3,}", "\n\n", result)
-    result = result.replace("\r\n", "\n").replace("\r", "\n")
+    # 统一换行符并清理多余空行，不间断空格按普通空格输出
+    result = "".join(builder.parts).replace("\r\n", "\n").translate(_CHAR_TRANSLATION)
+    result = _BLANK_LINES_RE.sub("\n\n", result)
 
     return result.strip()
 
@@ -3,104 +3,106 @@ MCP-ZenTao 数据模型包
 提供禅道API的所有数据模型和类型定义
 """
 
-# 通用模型
-from .common import (
-    ResponseStatus,
-    ZenTaoError,
-    BaseResponse,
-    DataResponse,
-    StringDataResponse,
-    ListResponse,
-    PaginationParams,
-    SortParams,
-    FilterParams,
-    CommonOperationResponse,
-    CommonStatus,
-    YesNoFlag,
-    ZERO_DATE,
-    ZERO_DATETIME,
-    validate_date_string,
-    validate_datetime_string,
-)
+import importlib
+from typing import Any, Dict, List
 
-# 分页模型
-from .pagination import (
-    SortOrder,
-    SortField, 
-    PageParams,
-    PagerInfo,
-    PaginatedListParams,
-    PaginatedResponse,
-    PaginationHelper,
-)
+# 导出名称 -> 所在子模块。模型在首次访问时才导入（PEP 562），
+# 只用到部分模型时不必为其余模型付出 pydantic 的类构建开销
+_LAZY_EXPORTS: Dict[str, str] = {
+    # 通用模型
+    "ResponseStatus": "common",
+    "ZenTaoError": "common",
+    "BaseResponse": "common",
+    "DataResponse": "common",
+    "StringDataResponse": "common",
+    "ListResponse": "common",
+    "PaginationParams": "common",
+    "SortParams": "common",
+    "FilterParams": "common",
+    "CommonOperationResponse": "common",
+    "CommonStatus": "common",
+    "YesNoFlag": "common",
+    "ZERO_DATE": "common",
+    "ZERO_DATETIME": "common",
+    "validate_date_string": "common",
+    "validate_datetime_string": "common",
+    # 分页模型
+    "SortOrder": "pagination",
+    "SortField": "pagination",
+    "PageParams": "pagination",
+    "PagerInfo": "pagination",
+    "PaginatedListParams": "pagination",
+    "PaginatedResponse": "pagination",
+    "PaginationHelper": "pagination",
+    # 会话管理模型
+    "SessionData": "session",
+    "SessionResponse": "session",
+    "LoginRequest": "session",
+    "LoginResponse": "session",
+    "LogoutResponse": "session",
+    # 用户管理模型
+    "UserRole": "user",
+    "UserGender": "user",
+    "UserStatus": "user",
+    "UserRights": "user",
+    "UserView": "user",
+    "UserModel": "user",
+    "UserListResponse": "user",
+    "UserDetailResponse": "user",
+    # 项目管理模型
+    "ProjectType": "project",
+    "ProjectStatus": "project",
+    "ProjectACL": "project",
+    "ProjectPriority": "project",
+    "ProjectModel": "project",
+    "ProjectListData": "project",
+    "ProjectListResponse": "project",
+    "ProjectDetailResponse": "project",
+    "ProjectCreateRequest": "project",
+    "ProjectEditRequest": "project",
+    # 任务管理模型
+    "TaskType": "task",
+    "TaskStatus": "task",
+    "TaskPriority": "task",
+    "TaskModel": "task",
+    "TaskListData": "task",
+    "TaskListResponse": "task",
+    "TaskDetailResponse": "task",
+    "TaskCreateRequest": "task",
+    "TaskEditRequest": "task",
+    "TaskFinishRequest": "task",
+    "TaskAssignRequest": "task",
+    # 缺陷管理模型
+    "BugSeverity": "bug",
+    "BugPriority": "bug",
+    "BugStatus": "bug",
+    "BugType": "bug",
+    "BugResolution": "bug",
+    "BugModel": "bug",
+    "BugListData": "bug",
+    "BugListResponse": "bug",
+    "BugDetailResponse": "bug",
+    "BugCreateRequest": "bug",
+    "BugEditRequest": "bug",
+    "BugResolveRequest": "bug",
+    "BugAssignRequest": "bug",
+    "BugConfirmRequest": "bug",
+}
 
-# 会话管理模型
-from .session import (
-    SessionData,
-    SessionResponse,
-    LoginRequest,
-    LoginResponse,
-    LogoutResponse,
-)
 
-# 用户管理模型
-from .user import (
-    UserRole,
-    UserGender,
-    UserStatus,
-    UserRights,
-    UserView,
-    UserModel,
-    UserListResponse,
-    UserDetailResponse,
-)
+def __getattr__(name: str) -> Any:
+    """按需导入模型所在的子模块，并缓存到包的命名空间中"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# 项目管理模型
-from .project import (
-    ProjectType,
-    ProjectStatus,
-    ProjectACL,
-    ProjectPriority,
-    ProjectModel,
-    ProjectListData,
-    ProjectListResponse,
-    ProjectDetailResponse,
-    ProjectCreateRequest,
-    ProjectEditRequest,
-)
 
-# 任务管理模型
-from .task import (
-    TaskType,
-    TaskStatus,
-    TaskPriority,
-    TaskModel,
-    TaskListData,
-    TaskListResponse,
-    TaskDetailResponse,
-    TaskCreateRequest,
-    TaskEditRequest,
-    TaskFinishRequest,
-    TaskAssignRequest,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# 缺陷管理模型
-from .bug import (
-    BugSeverity,
-    BugPriority,
-    BugStatus,
-    BugType,
-    BugResolution,
-    BugModel,
-    BugListData,
-    BugListResponse,
-    BugDetailResponse,
-    BugCreateRequest,
-    BugEditRequest,
-    BugResolveRequest,
-    BugAssignRequest,
-    BugConfirmRequest,
-)
 
 __all__ = [
     # 通用模型
@@ -3,11 +3,19 @@
 定义禅道缺陷相关的数据结构
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic import field_validator
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from collections import OrderedDict
+
+from .common import APIResponse, attach_enum_labels, json_loads
+from .pagination import PaginationHelper
+
+
+# 缺陷严重程度的中文描述和emoji
+_SEVERITY_TEXTS = {1: "提示", 2: "其他", 3: "一般", 4: "严重"}
+_SEVERITY_EMOJIS = {1: "💡", 2: "🔵", 3: "🟡", 4: "🔴"}
 
 
 class BugSeverity(int, Enum):
@@ -19,35 +27,27 @@ class BugSeverity(int, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            1: "提示",
-            2: "其他", 
-            3: "一般",
-            4: "严重"
-        }.get(self.value, f"级别{self.value}")
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
     
     @property
     def emoji(self) -> str:
         """严重程度对应的emoji"""
-        return {
-            1: "💡",
-            2: "🔵", 
-            3: "🟡",
-            4: "🔴"
-        }.get(self.value, "📊")
+        return self._emoji
     
     @property
     def display_text(self) -> str:
         """带表情符号的显示文本"""
-        return {
-            1: "💡提示",
-            2: "🔵其他", 
-            3: "🟡一般",
-            4: "🔴严重"
-        }.get(self.value, f"📊级别{self.value}")
+        return self._display_text
+
+
+attach_enum_labels(BugSeverity, _SEVERITY_TEXTS, _SEVERITY_EMOJIS)
+
+# 缺陷优先级的中文描述和emoji
+_PRIORITY_TEXTS = {0: "无", 1: "高", 2: "中", 3: "低", 4: "紧急"}
+_PRIORITY_EMOJIS = {0: "⚪", 1: "🟠", 2: "🟡", 3: "🟢", 4: "🔥"}
 
 
 class BugPriority(int, Enum):
@@ -60,38 +60,27 @@ class BugPriority(int, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            0: "无",
-            1: "高",
-            2: "中", 
-            3: "低",
-            4: "紧急"
-        }.get(self.value, f"级别{self.value}")
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
     
     @property
     def emoji(self) -> str:
         """优先级对应的emoji"""
-        return {
-            0: "⚪",
-            1: "🟠",
-            2: "🟡",
-            3: "🟢",
-            4: "🔥"
-        }.get(self.value, "📊")
+        return self._emoji
     
     @property
     def display_text(self) -> str:
         """带表情符号的显示文本"""
-        return {
-            0: "⚪无",
-            1: "🟠高",
-            2: "🟡中", 
-            3: "🟢低",
-            4: "🔥紧急"
-        }.get(self.value, f"📊级别{self.value}")
+        return self._display_text
+
+
+attach_enum_labels(BugPriority, _PRIORITY_TEXTS, _PRIORITY_EMOJIS)
+
+# 缺陷状态的中文描述和emoji
+_STATUS_TEXTS = {"active": "激活", "resolved": "已解决", "closed": "已关闭"}
+_STATUS_EMOJIS = {"active": "🔥", "resolved": "✅", "closed": "🔒"}
 
 
 class BugStatus(str, Enum):
@@ -102,32 +91,51 @@ class BugStatus(str, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            "active": "激活",
-            "resolved": "已解决", 
-            "closed": "已关闭"
-        }.get(self.value, self.value)
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
     
     @property
     def emoji(self) -> str:
         """状态对应的emoji"""
-        return {
-            "active": "🔥",
-            "resolved": "✅",
-            "closed": "🔒"
-        }.get(self.value, "📝")
+        return self._emoji
     
     @property
     def display_text(self) -> str:
         """带表情符号的显示文本"""
-        return {
-            "active": "🔥激活",
-            "resolved": "✅已解决", 
-            "closed": "🔒已关闭"
-        }.get(self.value, f"🔍{self.value}")
+        return self._display_text
+
+
+attach_enum_labels(BugStatus, _STATUS_TEXTS, _STATUS_EMOJIS)
+
+# 缺陷类型的中文描述
+_TYPE_TEXTS = {
+    "codeerror": "代码错误",
+    "interface": "界面优化",
+    "config": "配置相关",
+    "install": "安装部署",
+    "security": "安全相关",
+    "performance": "性能问题",
+    "standard": "标准规范",
+    "automation": "测试脚本",
+    "others": "其他",
+    # 中文系统特有类型
+    "gnwt": "功能问题",
+    "lwt": "历史遗留",
+    "jmlj": "界面交互",
+    "jmyh": "界面优化",
+    "xnwt": "性能问题",
+    "jrxwt": "兼容性问题",
+    "sjwt": "随机问题",
+    "xgyr": "修改引入",
+    "yhfk": "用户反馈",
+    "xqjy": "需求建议",
+    "xzxq": "新增需求",
+    "sjqx": "设计问题",
+    "pzwt": "配置问题",
+    "qt": "其他",
+}
 
 
 class BugType(str, Enum):
@@ -160,35 +168,25 @@ class BugType(str, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            "codeerror": "代码错误",
-            "interface": "界面优化", 
-            "config": "配置相关",
-            "install": "安装部署",
-            "security": "安全相关",
-            "performance": "性能问题",
-            "standard": "标准规范",
-            "automation": "测试脚本",
-            "others": "其他",
-            # 中文系统特有类型
-            "gnwt": "功能问题",
-            "lwt": "历史遗留",
-            "jmlj": "界面交互",
-            "jmyh": "界面优化",
-            "xnwt": "性能问题",
-            "jrxwt": "兼容性问题",
-            "sjwt": "随机问题",
-            "xgyr": "修改引入",
-            "yhfk": "用户反馈",
-            "xqjy": "需求建议",
-            "xzxq": "新增需求",
-            "sjqx": "设计问题",
-            "pzwt": "配置问题",
-            "qt": "其他"
-        }.get(self.value, self.value)
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
+
+
+attach_enum_labels(BugType, _TYPE_TEXTS)
+
+# 缺陷解决方案的中文描述
+_RESOLUTION_TEXTS = {
+    "fixed": "已修复",
+    "postponed": "延期处理",
+    "willnotfix": "不予修复",
+    "bydesign": "设计如此",
+    "duplicate": "重复Bug",
+    "external": "外部原因",
+    "notrepro": "无法重现",
+    "nonproblem": "非问题",
+}
 
 
 class BugResolution(str, Enum):
@@ -204,19 +202,33 @@ class BugResolution(str, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            "fixed": "已修复",
-            "postponed": "延期处理", 
-            "willnotfix": "不予修复",
-            "bydesign": "设计如此",
-            "duplicate": "重复Bug",
-            "external": "外部原因",
-            "notrepro": "无法重现",
-            "nonproblem": "非问题"
-        }.get(self.value, self.value)
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
+
+
+attach_enum_labels(BugResolution, _RESOLUTION_TEXTS)
+
+# 缺陷操作类型的中文描述和emoji
+_ACTION_TEXTS = {
+    "opened": "创建",
+    "commented": "添加备注",
+    "assigned": "指派给",
+    "resolved": "解决",
+    "closed": "关闭",
+    "activated": "激活",
+    "edited": "编辑",
+}
+_ACTION_EMOJIS = {
+    "opened": "📌",
+    "commented": "💬",
+    "assigned": "👤",
+    "resolved": "✅",
+    "closed": "🔒",
+    "activated": "🔄",
+    "edited": "✏️",
+}
 
 
 class BugActionType(str, Enum):
@@ -231,43 +243,40 @@ class BugActionType(str, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            "opened": "创建",
-            "commented": "添加备注",
-            "assigned": "指派给",
-            "resolved": "解决",
-            "closed": "关闭",
-            "activated": "激活",
-            "edited": "编辑"
-        }.get(self.value, self.value)
+        return self._text
     
     @property
     def emoji(self) -> str:
         """操作类型对应的emoji"""
-        return {
-            "opened": "📌",
-            "commented": "💬",
-            "assigned": "👤",
-            "resolved": "✅",
-            "closed": "🔒",
-            "activated": "🔄",
-            "edited": "✏️"
-        }.get(self.value, "📝")
+        return self._emoji
     
     @property
     def display_text(self) -> str:
         """带表情符号的显示文本"""
-        return f"{self.emoji}{str(self)}"
+        return self._display_text
+
+
+attach_enum_labels(BugActionType, _ACTION_TEXTS, _ACTION_EMOJIS)
+
 
+def _bool_from_flag(v: Any) -> bool:
+    """将禅道的字符串标志'0'/'1'转换为布尔值"""
+    return v == "1" if type(v) is str else bool(v)
 
-class ActionHistoryItem(BaseModel):
-    """操作历史变更条目"""
-    id: str = Field(description="历史记录ID")
-    action: str = Field(description="关联的操作ID")
-    field: str = Field(description="变更字段名")
-    old: str = Field(description="旧值")
-    new: str = Field(description="新值")  
-    diff: str = Field(default="", description="差异信息")
+
+@dataclass(frozen=True, slots=True)
+class ActionHistoryItem:
+    """操作历史变更条目
+    
+    缺陷详情中每条操作可能带有大量变更条目，使用无 __dict__ 的数据类
+    而非 BaseModel，由 Pydantic 在解析 BugAction 时按字段类型校验。
+    """
+    id: str       # 历史记录ID
+    action: str   # 关联的操作ID
+    field: str    # 变更字段名
+    old: str      # 旧值
+    new: str      # 新值
+    diff: str = ""  # 差异信息
     
     def __str__(self) -> str:
         """友好的字符串表示"""
@@ -299,9 +308,7 @@ class BugAction(BaseModel):
     @classmethod
     def validate_boolean_from_string(cls, v):
         """将字符串'0'/'1'转换为布尔值"""
-        if isinstance(v, str):
-            return v == "1"
-        return bool(v)
+        return _bool_from_flag(v)
 
 
 class BugModel(BaseModel):
@@ -335,7 +342,7 @@ class BugModel(BaseModel):
     status: BugStatus = Field(description="缺陷状态")
     subStatus: Optional[str] = Field(default="", description="子状态")
     color: Optional[str] = Field(default="", description="颜色标识")
-    confirmed: str = Field(description="是否确认，1=已确认，0=未确认")
+    confirmed: bool = Field(description="是否已确认（禅道返回 1/0）")
     
     # 创建信息
     openedBy: str = Field(description="创建者")
@@ -369,7 +376,7 @@ class BugModel(BaseModel):
     lastEditedDate: str = Field(description="最后编辑时间")
     
     # 删除标识
-    deleted: str = Field(description="是否删除，0=未删除")
+    deleted: bool = Field(description="是否已删除（禅道返回 1/0）")
     
     # 重复缺陷
     duplicateBug: str = Field(description="重复的缺陷ID")
@@ -402,6 +409,12 @@ class BugModel(BaseModel):
             return None
         return v
     
+    @field_validator('confirmed', 'deleted', mode='before')
+    @classmethod
+    def validate_flags(cls, v):
+        """将禅道以字符串'0'/'1'返回的标志字段转换为布尔值"""
+        return _bool_from_flag(v)
+    
     @field_validator('resolution', mode='before')
     @classmethod
     def validate_resolution(cls, v):
@@ -410,135 +423,66 @@ class BugModel(BaseModel):
             return None
         return v
 
+    # 以下字段已由 Pydantic 校验为对应的枚举，显示文本直接取枚举成员预先设置的描述
     def get_type_display(self) -> str:
         """获取类型的中文显示"""
-        if not self.type:
-            return "未指定"
-        
-        # 如果是字符串格式的枚举值，直接使用映射
-        if isinstance(self.type, str):
-            try:
-                return BugType(self.type).__str__()
-            except ValueError:
-                return self.type
-        elif isinstance(self.type, BugType):
-            return str(self.type)
-        else:
-            return str(self.type)
+        return str(self.type) if self.type else "未指定"
     
     def get_severity_display(self) -> str:
         """获取严重程度的中文显示"""
-        if isinstance(self.severity, BugSeverity):
-            return str(self.severity)
-        elif isinstance(self.severity, int):
-            return BugSeverity(self.severity).__str__()
         return str(self.severity)
     
     def get_severity_display_with_emoji(self) -> str:
         """获取严重程度的带表情符号显示"""
-        if isinstance(self.severity, BugSeverity):
-            return self.severity.display_text
-        elif isinstance(self.severity, int):
-            return BugSeverity(self.severity).display_text
-        return str(self.severity)
+        return self.severity.display_text
     
     def get_priority_display(self) -> str:
         """获取优先级的中文显示"""
-        if isinstance(self.pri, BugPriority):
-            return str(self.pri)
-        elif isinstance(self.pri, int):
-            return BugPriority(self.pri).__str__()
         return str(self.pri)
     
     def get_priority_display_with_emoji(self) -> str:
         """获取优先级的带表情符号显示"""
-        if isinstance(self.pri, BugPriority):
-            return self.pri.display_text
-        elif isinstance(self.pri, int):
-            return BugPriority(self.pri).display_text
-        return str(self.pri)
+        return self.pri.display_text
     
     def get_status_display(self) -> str:
         """获取状态的中文显示"""
-        if isinstance(self.status, BugStatus):
-            return str(self.status)
-        elif isinstance(self.status, str):
-            try:
-                return BugStatus(self.status).__str__()
-            except ValueError:
-                return self.status
         return str(self.status)
     
     def get_status_display_with_emoji(self) -> str:
         """获取状态的带表情符号显示"""
-        if isinstance(self.status, BugStatus):
-            return self.status.display_text
-        elif isinstance(self.status, str):
-            try:
-                return BugStatus(self.status).display_text
-            except ValueError:
-                return str(self.status)
-        return str(self.status)
+        return self.status.display_text
     
     def get_resolution_display(self) -> str:
         """获取解决方案的中文显示"""
-        if not self.resolution:
-            return ""
-        if isinstance(self.resolution, BugResolution):
-            return str(self.resolution)
-        elif isinstance(self.resolution, str):
-            try:
-                return BugResolution(self.resolution).__str__()
-            except ValueError:
-                return self.resolution
-        return str(self.resolution)
+        return str(self.resolution) if self.resolution else ""
 
     def __repr__(self) -> str:
         """简洁的字符串表示"""
         return f"Bug({self.id}: {self.title} - {self.status.value})"
 
-    def display_fields(self) -> OrderedDict[str, Any]:
+    def display_fields(self) -> Dict[str, Any]:
         """返回与禅道界面字段匹配的有序字典"""
-        return OrderedDict([
-            ("ID", self.id),
-            ("级别", self._get_severity_display()),
-            ("P", self._get_priority_display()),
-            ("类型", self._get_type_display()),
-            ("Bug标题", self.title),
-            ("创建", self.openedBy),
-            ("指派给", self.assignedTo),
-            ("解决", self.resolvedBy or ""),
-            ("方案", self._get_resolution_display()),
-        ])
-
-    def _get_severity_display(self) -> str:
-        """获取严重程度的中文显示"""
-        return str(self.severity)
-
-    def _get_priority_display(self) -> str:
-        """获取优先级的中文显示"""
-        return str(self.pri)
-
-    def _get_type_display(self) -> str:
-        """获取类型的中文显示"""
-        return str(self.type)
-
-    def _get_resolution_display(self) -> str:
-        """获取解决方案的中文显示"""
-        if self.resolution is None:
-            return ""
-        return str(self.resolution)
-
-    def _get_status_display(self) -> str:
-        """获取状态的中文显示"""
-        return str(self.status)
+        return {
+            "ID": self.id,
+            "级别": self.get_severity_display(),
+            "P": self.get_priority_display(),
+            "类型": self.get_type_display(),
+            "Bug标题": self.title,
+            "创建": self.openedBy,
+            "指派给": self.assignedTo,
+            "解决": self.resolvedBy or "",
+            "方案": self.get_resolution_display(),
+        }
 
     def available_actions(self) -> Dict[str, bool]:
         """返回可用操作的状态"""
+        # status 已校验为枚举成员，直接按身份比较
+        status = self.status
+        active = status is BugStatus.ACTIVE
         return {
-            "已确认": self.status == BugStatus.ACTIVE and self.confirmed == "0",
-            "已解决": self.status == BugStatus.ACTIVE and self.confirmed == "1",
-            "已关闭": self.status == BugStatus.RESOLVED
+            "已确认": active and not self.confirmed,
+            "已解决": active and self.confirmed,
+            "已关闭": status is BugStatus.RESOLVED
         }
 
 
@@ -569,26 +513,40 @@ class BugListData(BaseModel):
         return self.bugs
 
 
-class BugListResponse(BaseModel):
+class BugListResponse(APIResponse):
     """获取缺陷列表的API响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的缺陷数据")
     
+    _raw_data: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _bug_data: Optional[BugListData] = PrivateAttr(default=None)
+    
     def get_bug_data(self) -> BugListData:
-        """解析data字段并返回BugListData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return BugListData.model_validate(parsed_data)
+        """解析data字段并返回BugListData对象（只解析一次）"""
+        if self._bug_data is None:
+            if self._raw_data is None:
+                # 尚未为分页解码过时，由 pydantic-core 一次完成解析和校验，不构建中间字典
+                self._bug_data = BugListData.model_validate_json(self.data)
+            else:
+                self._bug_data = BugListData.model_validate(self._raw_data)
+        return self._bug_data
     
     def get_bug_list(self) -> List[BugListItem]:
         """获取缺陷列表"""
-        bug_data = self.get_bug_data()
-        return bug_data.get_bug_list()
+        return self.get_bug_data().bugs
     
     def get_bug_list_data(self) -> Dict[str, Any]:
-        """获取原始缺陷列表数据（用于分页）"""
-        import json
-        return json.loads(self.data)
+        """获取原始缺陷列表数据（用于分页）
+        
+        data字段只解码一次，分页与列表解析共享同一份结果。
+        """
+        if self._raw_data is None:
+            self._raw_data = json_loads(self.data)
+        return self._raw_data
+    
+    def get_rec_total(self) -> int:
+        """获取总记录数（用于分页）"""
+        return PaginationHelper.extract_rec_total(self.get_bug_list_data())
 
 
 class BugDetailData(BaseModel):
@@ -609,17 +567,22 @@ class BugDetailData(BaseModel):
     pager: Optional[Any] = Field(default=None, description="分页信息")
 
 
-class BugDetailResponse(BaseModel):
+class BugDetailResponse(APIResponse):
     """缺陷详情响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的详情数据")
     md5: Optional[str] = Field(default=None, description="数据MD5校验")
     
+    _detail_data: Optional[BugDetailData] = PrivateAttr(default=None)
+    
     def get_bug_detail_data(self) -> BugDetailData:
-        """解析data字段并返回BugDetailData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return BugDetailData.model_validate(parsed_data)
+        """解析data字段并返回BugDetailData对象（只解析一次）
+        
+        缺陷、用户、产品、版本等映射共享同一份解析结果。
+        """
+        if self._detail_data is None:
+            self._detail_data = BugDetailData.model_validate_json(self.data)
+        return self._detail_data
     
     def get_bug(self) -> BugModel:
         """获取缺陷详细信息"""
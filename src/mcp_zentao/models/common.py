@@ -17,10 +17,21 @@
 - 灵活性：支持禅道API的各种响应格式
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Any, Generic, TypeVar, List, Dict, Union
+import json
+from datetime import datetime
+
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, model_validator
+from typing import Optional, Any, Generic, TypeVar, List, Dict, Type, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时使用标准库 json
+    orjson = None
+
+# JSON解析函数，安装了 orjson 时使用其更快的实现
+json_loads = orjson.loads if orjson is not None else json.loads
+
 # 泛型类型变量，用于支持不同类型的数据
 T = TypeVar('T')
 
@@ -85,7 +96,34 @@ class ZenTaoError(Exception):
         return f"ZenTaoError(status='{self.status}', message='{self.message}', data={self.data})"
 
 
-class BaseResponse(BaseModel, Generic[T]):
+# 解析API响应时使用的校验上下文，启用 APIResponse 的状态检查
+STATUS_CHECK_CONTEXT: Dict[str, bool] = {'check_status': True}
+
+
+class APIResponse(BaseModel):
+    """禅道API响应基类
+    
+    以 STATUS_CHECK_CONTEXT 作为上下文校验时，在字段校验之前检查响应状态，
+    非成功状态直接抛出 ZenTaoError，一次校验即可区分成功与错误响应。
+    直接构造模型时不做检查。
+    """
+    
+    @model_validator(mode='before')
+    @classmethod
+    def _check_status(cls, data: Any, info: ValidationInfo) -> Any:
+        """非成功状态时抛出禅道错误"""
+        if info.context and info.context.get('check_status') and isinstance(data, dict):
+            status = data.get('status')
+            if status != 'success':
+                raise ZenTaoError(
+                    status=status or "error",
+                    message=data.get('message') or '未知错误',
+                    data=data.get('data')
+                )
+        return data
+
+
+class BaseResponse(APIResponse, Generic[T]):
     """基础响应模型
     
     定义禅道API响应的基本结构。这是一个泛型模型，
@@ -208,8 +246,7 @@ class StringDataResponse(BaseResponse):
         Raises:
             json.JSONDecodeError: 当data不是有效的JSON字符串时
         """
-        import json
-        return json.loads(self.data)
+        return json_loads(self.data)
 
 
 class ListResponse(BaseResponse[T]):
@@ -295,6 +332,23 @@ class CommonOperationResponse(BaseResponse):
     """通用操作响应（创建、更新、删除等）"""
     id: Optional[str] = Field(default=None, description="操作对象的ID")
     affected_rows: Optional[int] = Field(default=None, description="影响的行数")
+    data: Optional[Union[str, Dict[str, Any]]] = Field(
+        default=None, description="操作返回的数据，可能是JSON字符串或对象"
+    )
+    
+    _data_dict: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    def get_data_dict(self) -> Dict[str, Any]:
+        """获取解析后的data字段，只解析一次；无法解析为对象时返回空字典"""
+        if self._data_dict is None:
+            data = self.data
+            if isinstance(data, str):
+                try:
+                    data = json_loads(data)
+                except ValueError:
+                    data = None
+            self._data_dict = data if isinstance(data, dict) else {}
+        return self._data_dict
 
 
 # 常用的状态枚举
@@ -314,6 +368,23 @@ class YesNoFlag(str, Enum):
     NO = "0"
 
 
+# 枚举显示辅助函数
+def attach_enum_labels(
+    enum_cls: Type[Enum],
+    texts: Dict[Any, str],
+    emojis: Optional[Dict[Any, str]] = None
+) -> None:
+    """在类定义后为每个枚举成员预先设置中文描述和emoji
+    
+    __str__/emoji/display_text 调用时只读取成员属性，不再每次构造字典并查找。
+    """
+    for member in enum_cls:
+        member._text = texts[member.value]
+        if emojis is not None:
+            member._emoji = emojis[member.value]
+            member._display_text = member._emoji + member._text
+
+
 # 日期时间相关常量
 ZERO_DATE = "0000-00-00"
 ZERO_DATETIME = "0000-00-00 00:00:00"
@@ -325,7 +396,6 @@ def validate_date_string(date_str: str) -> bool:
     if date_str == ZERO_DATE:
         return True
     try:
-        from datetime import datetime
         datetime.strptime(date_str, "%Y-%m-%d")
         return True
     except ValueError:
@@ -337,7 +407,6 @@ def validate_datetime_string(datetime_str: str) -> bool:
     if datetime_str == ZERO_DATETIME:
         return True
     try:
-        from datetime import datetime
         datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
         return True
     except ValueError:
@@ -171,6 +171,28 @@ class PaginationHelper:
         except Exception:
             return None
     
+    @staticmethod
+    def extract_rec_total(data: Dict[str, Any]) -> int:
+        """从API响应数据中提取总记录数
+        
+        优先读取顶层的 recTotal，没有时读取 pager 中的 recTotal。
+        
+        Args:
+            data: 解析后的API响应数据
+            
+        Returns:
+            总记录数，无法获取时返回0
+        """
+        rec_total = data.get('recTotal')
+        if rec_total is None:
+            pager_data = data.get('pager')
+            if isinstance(pager_data, dict):
+                rec_total = pager_data.get('recTotal')
+        try:
+            return int(rec_total or 0)
+        except (TypeError, ValueError):
+            return 0
+    
     @staticmethod
     def calculate_page_range(current_page: int, total_pages: int, window_size: int = 5) -> List[int]:
         """计算分页显示范围
@@ -3,11 +3,25 @@
 定义禅道项目相关的数据结构
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from datetime import date
-from collections import OrderedDict
+
+from .common import APIResponse, attach_enum_labels, json_loads
+from .pagination import PaginationHelper
+
+# 项目角色的中文显示，角色映射可能需要根据实际系统进行调整
+_PROJECT_ROLE_DISPLAY = {
+    "po": "产品经理",
+    "pm": "项目经理",
+    "qd": "测试负责人",
+    "rd": "开发负责人",
+    "dev": "开发人员",
+    "test": "测试人员",
+    "pm1": "项目经理",
+    "admin": "管理员",
+}
 
 
 class ProjectType(str, Enum):
@@ -17,6 +31,11 @@ class ProjectType(str, Enum):
     KANBAN = "kanban"      # 看板项目
 
 
+# 项目状态的中文描述和emoji
+_STATUS_TEXTS = {"wait": "未开始", "doing": "进行中", "suspended": "已挂起", "closed": "已关闭"}
+_STATUS_EMOJIS = {"wait": "⏸️", "doing": "🔄", "suspended": "⏯️", "closed": "✅"}
+
+
 class ProjectStatus(str, Enum):
     """项目状态枚举"""
     WAIT = "wait"          # 未开始
@@ -26,35 +45,23 @@ class ProjectStatus(str, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            "wait": "未开始",
-            "doing": "进行中",
-            "suspended": "已挂起",
-            "closed": "已关闭"
-        }.get(self.value, self.value)
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
     
     @property
     def emoji(self) -> str:
         """状态对应的emoji"""
-        return {
-            "wait": "⏸️",
-            "doing": "🔄",
-            "suspended": "⏯️",
-            "closed": "✅"
-        }.get(self.value, "📝")
+        return self._emoji
     
     @property
     def display_text(self) -> str:
         """带表情符号的显示文本"""
-        return {
-            "wait": "⏸️未开始",
-            "doing": "🔄进行中",
-            "suspended": "⏯️已挂起",
-            "closed": "✅已关闭"
-        }.get(self.value, f"📝{self.value}")
+        return self._display_text
+
+
+attach_enum_labels(ProjectStatus, _STATUS_TEXTS, _STATUS_EMOJIS)
 
 
 class ProjectACL(str, Enum):
@@ -64,6 +71,10 @@ class ProjectACL(str, Enum):
     CUSTOM = "custom"      # 自定义
 
 
+# 项目优先级的中文描述
+_PRIORITY_TEXTS = {1: "低", 2: "正常", 3: "高", 4: "紧急"}
+
+
 class ProjectPriority(int, Enum):
     """项目优先级枚举"""
     LOW = 1      # 低
@@ -73,15 +84,13 @@ class ProjectPriority(int, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            1: "低",
-            2: "正常",
-            3: "高",
-            4: "紧急"
-        }.get(self.value, f"级别{self.value}")
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
+
+
+attach_enum_labels(ProjectPriority, _PRIORITY_TEXTS)
 
 
 class ProjectModel(BaseModel):
@@ -163,19 +172,19 @@ class ProjectModel(BaseModel):
         """获取状态的带表情符号显示"""
         return self.status.display_text
 
-    def display_fields(self) -> OrderedDict[str, Any]:
+    def display_fields(self) -> Dict[str, Any]:
         """返回与禅道界面字段匹配的有序字典"""
-        return OrderedDict([
-            ("ID", self.id),
-            ("项目代号", self.code),
-            ("项目名称", self.name),
-            ("开始日期", self.begin),
-            ("截止日期", self.end),
-            ("状态", self._get_status_display()),
-            ("角色", self._get_role_display()),
-            ("加盟日", self.join),
-            ("可用工时/天", self._get_available_hours_display()),
-        ])
+        return {
+            "ID": self.id,
+            "项目代号": self.code,
+            "项目名称": self.name,
+            "开始日期": self.begin,
+            "截止日期": self.end,
+            "状态": self._get_status_display(),
+            "角色": self._get_role_display(),
+            "加盟日": self.join,
+            "可用工时/天": self._get_available_hours_display(),
+        }
 
     def _get_status_display(self) -> str:
         """获取状态的中文显示"""
@@ -183,18 +192,7 @@ class ProjectModel(BaseModel):
 
     def _get_role_display(self) -> str:
         """获取角色的中文显示"""
-        # 角色映射可能需要根据实际系统进行调整
-        role_map = {
-            "po": "产品经理",
-            "pm": "项目经理", 
-            "qd": "测试负责人",
-            "rd": "开发负责人",
-            "dev": "开发人员",
-            "test": "测试人员",
-            "pm1": "项目经理",
-            "admin": "管理员"
-        }
-        return role_map.get(self.role.lower(), self.role)
+        return _PROJECT_ROLE_DISPLAY.get(self.role.lower(), self.role)
 
     def _get_available_hours_display(self) -> str:
         """获取可用工时显示"""
@@ -208,13 +206,18 @@ class ProjectModel(BaseModel):
 
     def available_actions(self) -> Dict[str, bool]:
         """返回可用操作的状态"""
+        # status 已校验为枚举成员，直接按身份比较
+        status = self.status
+        doing = status is ProjectStatus.DOING
+        suspended = status is ProjectStatus.SUSPENDED
+        closed = status is ProjectStatus.CLOSED
         return {
-            "开始": self.status == ProjectStatus.WAIT,
-            "挂起": self.status == ProjectStatus.DOING,
-            "激活": self.status == ProjectStatus.SUSPENDED,
-            "关闭": self.status in [ProjectStatus.DOING, ProjectStatus.SUSPENDED],
-            "编辑": self.status != ProjectStatus.CLOSED,
-            "删除": self.status == ProjectStatus.CLOSED
+            "开始": status is ProjectStatus.WAIT,
+            "挂起": doing,
+            "激活": suspended,
+            "关闭": doing or suspended,
+            "编辑": not closed,
+            "删除": closed
         }
 
 
@@ -239,16 +242,19 @@ class ProjectListData(BaseModel):
         return self.projects
 
 
-class ProjectListResponse(BaseModel):
+class ProjectListResponse(APIResponse):
     """获取项目列表的API响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的项目数据")
     
+    _raw_data: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _project_data: Optional[ProjectListData] = PrivateAttr(default=None)
+    
     def get_project_data(self) -> ProjectListData:
-        """解析data字段并返回ProjectListData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return ProjectListData.model_validate(parsed_data)
+        """解析data字段并返回ProjectListData对象（只解析一次）"""
+        if self._project_data is None:
+            self._project_data = ProjectListData.model_validate(self.get_project_list_data())
+        return self._project_data
     
     def get_project_list(self) -> List[ProjectModel]:
         """获取项目列表"""
@@ -256,9 +262,17 @@ class ProjectListResponse(BaseModel):
         return project_data.get_project_list()
     
     def get_project_list_data(self) -> Dict[str, Any]:
-        """获取原始项目列表数据（用于分页）"""
-        import json
-        return json.loads(self.data)
+        """获取原始项目列表数据（用于分页）
+        
+        data字段只解码一次，分页与列表解析共享同一份结果。
+        """
+        if self._raw_data is None:
+            self._raw_data = json_loads(self.data)
+        return self._raw_data
+    
+    def get_rec_total(self) -> int:
+        """获取总记录数（用于分页）"""
+        return PaginationHelper.extract_rec_total(self.get_project_list_data())
 
 
 class ProjectDetailResponse(BaseModel):
@@ -296,17 +310,23 @@ class ProjectTaskData(BaseModel):
     setModule: bool = Field(description="是否设置模块")
 
 
-class ProjectTaskResponse(BaseModel):
+class ProjectTaskResponse(APIResponse):
     """项目任务响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的任务数据")
     md5: Optional[str] = Field(default=None, description="数据MD5校验")
     
+    _task_data: Optional[ProjectTaskData] = PrivateAttr(default=None)
+    
     def get_project_task_data(self) -> ProjectTaskData:
-        """解析data字段并返回ProjectTaskData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return ProjectTaskData.model_validate(parsed_data)
+        """解析data字段并返回ProjectTaskData对象
+        
+        data字段在首次访问时才解析和校验，结果会被缓存，
+        只使用响应中部分信息的调用方无需为其余数据付出解析成本。
+        """
+        if self._task_data is None:
+            self._task_data = ProjectTaskData.model_validate_json(self.data)
+        return self._task_data
     
     def get_project_info(self) -> Dict[str, Any]:
         """获取项目信息"""
@@ -363,7 +383,7 @@ class ProjectBugData(BaseModel):
     param: int = Field(description="参数")
 
 
-class ProjectBugResponse(BaseModel):
+class ProjectBugResponse(APIResponse):
     """项目缺陷响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的缺陷数据")
@@ -371,9 +391,7 @@ class ProjectBugResponse(BaseModel):
     
     def get_project_bug_data(self) -> ProjectBugData:
         """解析data字段并返回ProjectBugData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return ProjectBugData.model_validate(parsed_data)
+        return ProjectBugData.model_validate_json(self.data)
     
     def get_project_info(self) -> Dict[str, Any]:
         """获取项目信息"""
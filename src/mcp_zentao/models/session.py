@@ -21,9 +21,10 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, Dict, Any
 from enum import Enum
-import json
 
-from .common import ResponseStatus, StringDataResponse, DataResponse, BaseResponse
+from .common import (
+    APIResponse, ResponseStatus, StringDataResponse, DataResponse, BaseResponse, json_loads
+)
 
 
 class SessionData(BaseModel):
@@ -133,7 +134,7 @@ class SessionResponse(StringDataResponse):
             json.JSONDecodeError: 当data字段不是有效的JSON时
             ValidationError: 当解析后的数据不符合SessionData模型时
         """
-        parsed_data = json.loads(self.data)
+        parsed_data = json_loads(self.data)
         return SessionData.model_validate(parsed_data)
     
     @property
@@ -286,7 +287,7 @@ class LoginResponse(BaseResponse):
         return None
 
 
-class LogoutResponse(BaseModel):
+class LogoutResponse(APIResponse):
     """用户登出的API响应模型
     
     对应API: GET /user-logout.json
@@ -324,7 +325,7 @@ UserID = str     # 用户ID类型别名
     # 注意：这里暂时使用 dict，后续会在 user.py 中定义详细的 UserModel
 
 
-class LogoutResponse(BaseModel):
+class LogoutResponse(APIResponse):
     """用户登出的 API 响应模型"""
     status: ResponseStatus = Field(description="登出操作的状态")
     
@@ -3,10 +3,14 @@
 定义禅道任务相关的数据结构
 """
 
-from pydantic import BaseModel, Field
+import sys
+
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from collections import OrderedDict
+
+from .common import APIResponse, attach_enum_labels, json_loads
+from .pagination import PaginationHelper
 
 
 class TaskType(str, Enum):
@@ -21,6 +25,25 @@ class TaskType(str, Enum):
     MISC = "misc"         # 其他
 
 
+# 任务状态的中文描述和emoji
+_STATUS_TEXTS = {
+    "wait": "未开始",
+    "doing": "进行中",
+    "done": "已完成",
+    "pause": "已暂停",
+    "cancel": "已取消",
+    "closed": "已关闭",
+}
+_STATUS_EMOJIS = {
+    "wait": "⏸️",
+    "doing": "🔄",
+    "done": "✅",
+    "pause": "⏯️",
+    "cancel": "❌",
+    "closed": "🔒",
+}
+
+
 class TaskStatus(str, Enum):
     """任务状态枚举"""
     WAIT = "wait"          # 未开始
@@ -32,41 +55,27 @@ class TaskStatus(str, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            "wait": "未开始",
-            "doing": "进行中",
-            "done": "已完成",
-            "pause": "已暂停",
-            "cancel": "已取消",
-            "closed": "已关闭"
-        }.get(self.value, self.value)
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
     
     @property
     def emoji(self) -> str:
         """状态对应的emoji"""
-        return {
-            "wait": "⏸️",
-            "doing": "🔄",
-            "done": "✅",
-            "pause": "⏯️",
-            "cancel": "❌",
-            "closed": "🔒"
-        }.get(self.value, "📝")
+        return self._emoji
     
     @property
     def display_text(self) -> str:
         """带表情符号的显示文本"""
-        return {
-            "wait": "⏸️未开始",
-            "doing": "🔄进行中",
-            "done": "✅已完成",
-            "pause": "⏯️已暂停",
-            "cancel": "❌已取消",
-            "closed": "🔒已关闭"
-        }.get(self.value, f"📝{self.value}")
+        return self._display_text
+
+
+attach_enum_labels(TaskStatus, _STATUS_TEXTS, _STATUS_EMOJIS)
+
+# 任务优先级的中文描述和emoji
+_PRIORITY_TEXTS = {0: "最低", 1: "低", 2: "正常", 3: "高", 4: "最高"}
+_PRIORITY_EMOJIS = {0: "📝", 1: "🟢", 2: "🟡", 3: "🟠", 4: "🚨"}
 
 
 class TaskPriority(int, Enum):
@@ -79,38 +88,23 @@ class TaskPriority(int, Enum):
     
     def __str__(self) -> str:
         """返回中文描述"""
-        return {
-            0: "最低",
-            1: "低",
-            2: "正常", 
-            3: "高",
-            4: "最高"
-        }.get(self.value, f"级别{self.value}")
+        return self._text
     
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._text
     
     @property
     def display_text(self) -> str:
         """带表情符号的显示文本"""
-        return {
-            0: "📝最低",
-            1: "🟢低",
-            2: "🟡正常", 
-            3: "🟠高",
-            4: "🚨最高"
-        }.get(self.value, f"📊级别{self.value}")
+        return self._display_text
     
     @property
     def emoji(self) -> str:
         """获取表情符号"""
-        return {
-            0: "📝",
-            1: "🟢",
-            2: "🟡", 
-            3: "🟠",
-            4: "🚨"
-        }.get(self.value, "📊")
+        return self._emoji
+
+
+attach_enum_labels(TaskPriority, _PRIORITY_TEXTS, _PRIORITY_EMOJIS)
 
 
 class TaskModel(BaseModel):
@@ -193,6 +187,17 @@ class TaskModel(BaseModel):
     # 进度计算
     progress: int = Field(description="完成进度百分比")
 
+    @field_validator(
+        'project', 'module', 'projectID', 'projectName', 'openedBy', 'assignedTo',
+        'finishedBy', 'canceledBy', 'closedBy', 'lastEditedBy', mode='before'
+    )
+    @classmethod
+    def intern_repeated_strings(cls, v):
+        """驻留在任务列表中大量重复的字符串（项目、模块、人员），相同取值共享同一个对象"""
+        if type(v) is str:
+            return sys.intern(v)
+        return v
+
     def __repr__(self) -> str:
         """简洁的字符串表示"""
         return f"Task({self.id}: {self.name} - {self.status.value})"
@@ -217,22 +222,22 @@ class TaskModel(BaseModel):
         """获取状态的带表情符号显示"""
         return self.status.display_text
 
-    def display_fields(self) -> OrderedDict[str, Any]:
+    def display_fields(self) -> Dict[str, Any]:
         """返回与禅道界面字段匹配的有序字典"""
-        return OrderedDict([
-            ("ID", self.id),
-            ("P", self.pri.value),
-            ("所属项目", self.projectName),
-            ("任务名称", self.name),
-            ("创建", self.openedBy),
-            ("指派给", self.assignedTo),
-            ("由谁完成", self.finishedBy or ""),
-            ("预计", self.estimate),
-            ("消耗", self.consumed),
-            ("剩余", self.left),
-            ("截止", self.deadline or ""),
-            ("状态", self._get_status_display()),
-        ])
+        return {
+            "ID": self.id,
+            "P": self.pri.value,
+            "所属项目": self.projectName,
+            "任务名称": self.name,
+            "创建": self.openedBy,
+            "指派给": self.assignedTo,
+            "由谁完成": self.finishedBy or "",
+            "预计": self.estimate,
+            "消耗": self.consumed,
+            "剩余": self.left,
+            "截止": self.deadline or "",
+            "状态": self._get_status_display(),
+        }
 
     def _get_status_display(self) -> str:
         """获取状态的中文显示"""
@@ -240,10 +245,12 @@ class TaskModel(BaseModel):
 
     def available_actions(self) -> Dict[str, bool]:
         """返回可用操作的状态"""
+        # status 已校验为枚举成员，直接按身份比较
+        status = self.status
         return {
-            "开始": self.status == TaskStatus.WAIT,
-            "关闭": self.status in [TaskStatus.DOING, TaskStatus.PAUSE],
-            "完成": self.status == TaskStatus.DOING
+            "开始": status is TaskStatus.WAIT,
+            "关闭": status is TaskStatus.DOING or status is TaskStatus.PAUSE,
+            "完成": status is TaskStatus.DOING
         }
 
 
@@ -267,16 +274,19 @@ class TaskListData(BaseModel):
     pager: Dict[str, Any] | None = Field(default=None, description="分页信息")
 
 
-class TaskListResponse(BaseModel):
+class TaskListResponse(APIResponse):
     """获取任务列表的API响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的任务数据")
     
+    _raw_data: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _task_data: Optional[TaskListData] = PrivateAttr(default=None)
+    
     def get_task_data(self) -> TaskListData:
-        """解析data字段并返回TaskListData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return TaskListData.model_validate(parsed_data)
+        """解析data字段并返回TaskListData对象（只解析一次）"""
+        if self._task_data is None:
+            self._task_data = TaskListData.model_validate(self.get_task_list_data())
+        return self._task_data
     
     def get_task_list(self) -> List[TaskModel]:
         """获取任务列表"""
@@ -284,9 +294,17 @@ class TaskListResponse(BaseModel):
         return task_data.tasks
     
     def get_task_list_data(self) -> Dict[str, Any]:
-        """获取原始任务列表数据（用于分页）"""
-        import json
-        return json.loads(self.data)
+        """获取原始任务列表数据（用于分页）
+        
+        data字段只解码一次，分页与列表解析共享同一份结果。
+        """
+        if self._raw_data is None:
+            self._raw_data = json_loads(self.data)
+        return self._raw_data
+    
+    def get_rec_total(self) -> int:
+        """获取总记录数（用于分页）"""
+        return PaginationHelper.extract_rec_total(self.get_task_list_data())
 
 
 class TaskDetailData(BaseModel):
@@ -302,7 +320,7 @@ class TaskDetailData(BaseModel):
     pager: Optional[Any] = Field(default=None, description="分页信息")
 
 
-class TaskDetailResponse(BaseModel):
+class TaskDetailResponse(APIResponse):
     """任务详情响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的详情数据")
@@ -310,9 +328,7 @@ class TaskDetailResponse(BaseModel):
     
     def get_task_detail_data(self) -> TaskDetailData:
         """解析data字段并返回TaskDetailData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return TaskDetailData.model_validate(parsed_data)
+        return TaskDetailData.model_validate_json(self.data)
     
     def get_task(self) -> TaskModel:
         """获取任务详细信息"""
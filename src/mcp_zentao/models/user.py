@@ -12,12 +12,7 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, Union
 from enum import Enum
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, List, Any, Union
-from enum import Enum
-from datetime import datetime
-
-from .common import DataResponse, StringDataResponse
+from .common import APIResponse
 
 
 class UserRole(str, Enum):
@@ -299,7 +294,7 @@ class UserListData(BaseModel):
     type: str = Field(description="类型")
 
 
-class UserListResponse(BaseModel):
+class UserListResponse(APIResponse):
     """用户列表响应"""
     status: str = Field(description="响应状态")
     data: str = Field(description="JSON字符串格式的用户数据")
@@ -307,9 +302,7 @@ class UserListResponse(BaseModel):
     
     def get_user_list_data(self) -> UserListData:
         """解析data字段并返回UserListData对象"""
-        import json
-        parsed_data = json.loads(self.data)
-        return UserListData.model_validate(parsed_data)
+        return UserListData.model_validate_json(self.data)
     
     def get_users(self) -> List[Dict[str, Any]]:
         """获取用户列表"""
@@ -323,7 +316,7 @@ class UserListResponse(BaseModel):
 
 
 # 用于获取特定用户信息的响应
-class UserDetailResponse(BaseModel):
+class UserDetailResponse(APIResponse):
     """用户详情响应"""
     status: str = Field(description="响应状态")
     user: UserModel = Field(description="用户详细信息")
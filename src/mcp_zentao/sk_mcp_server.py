@@ -356,7 +356,8 @@ class ZenTaoMCPServer:
                     "assigned_to": resolve_user(bug.assignedTo),
                     "opened_by": resolve_user(bug.openedBy),
                     "opened_date": bug.openedDate,
-                    "confirmed": bug.confirmed,
+                    # 保持禅道原有的 "1"/"0" 输出格式，模型中该字段已解析为布尔值
+                    "confirmed": "1" if bug.confirmed else "0",
                 },
                 "product": {
                     "id": bug.product,
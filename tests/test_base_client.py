@@ -0,0 +1,260 @@
+"""
+Offline tests for BaseClient request caching, coalescing and throttling.
+
+The ZenTao server is replaced by ``httpx.MockTransport`` so these tests run
+without network access or credentials.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from mcp_zentao.client.base_client import BaseClient, _freeze_params
+
+
+class Payload(BaseModel):
+    """Minimal response model with a status field."""
+
+    status: str
+    value: int = 0
+
+
+def make_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    client_cls: type[BaseClient] = BaseClient,
+    **kwargs: Any,
+) -> BaseClient:
+    """Build a client whose HTTP traffic is served by ``handler``."""
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    return client_cls("http://zentao.test", client=http, **kwargs)
+
+
+def test_concurrent_identical_gets_are_coalesced() -> None:
+    """Identical in-flight GETs share a single HTTP request and result."""
+    calls = 0
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        return httpx.Response(200, json={"status": "success", "value": 1})
+
+    client = make_client(handler)
+    results: list[Payload] = []
+    barrier = threading.Barrier(5)
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(client.get("api-test.json", Payload))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert client._inflight == {}
+
+
+def test_coalesced_error_is_raised_in_every_caller() -> None:
+    """A failed leader request propagates its exception to waiting callers."""
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        return httpx.Response(200, json={"status": "fail", "message": "boom"})
+
+    client = make_client(handler)
+    errors: list[Exception] = []
+    barrier = threading.Barrier(3)
+
+    def worker() -> None:
+        barrier.wait()
+        try:
+            client.get("api-test.json", Payload)
+        except Exception as e:  # noqa: BLE001 - collected for assertion
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 3
+    assert client._inflight == {}
+
+
+def test_request_slots_limit_concurrency() -> None:
+    """No more requests than the shared semaphore allows run at once."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return httpx.Response(200, json={"status": "success"})
+
+    slots = threading.BoundedSemaphore(2)
+    client = make_client(handler, request_slots=slots)
+    threads = [
+        threading.Thread(target=client.get, args=("api-test.json", Payload, {"page": n}))
+        for n in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert peak == 2
+
+
+def test_etag_not_modified_reuses_cached_model() -> None:
+    """A 304 answer to If-None-Match returns the previously parsed model."""
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"status": "success", "value": 7}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    first = client.get("api-test.json", Payload)
+    second = client.get("api-test.json", Payload)
+
+    assert seen == [None, '"v1"']
+    assert second is first
+    assert second.value == 7
+
+
+def test_response_cache_ttl_skips_request() -> None:
+    """Within the TTL a repeated GET is answered from the cache."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"status": "success", "value": calls})
+
+    class TTLClient(BaseClient):
+        response_cache_ttl = 60.0
+
+    client = make_client(handler, TTLClient)
+    assert client.get("api-test.json", Payload).value == 1
+    assert client.get("api-test.json", Payload).value == 1
+    assert calls == 1
+
+    client.clear_cache()
+    assert client.get("api-test.json", Payload).value == 2
+
+
+def test_unhashable_params_are_cached() -> None:
+    """List-valued query parameters still produce a usable cache key."""
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        return httpx.Response(200, json={"status": "success"}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    client.get("api-test.json", Payload, params={"ids": [1, 2]})
+    client.get("api-test.json", Payload, params={"ids": [1, 2]})
+    client.get("api-test.json", Payload, params={"ids": [2, 1]})
+
+    assert seen == [None, '"v1"', None]
+
+
+def test_freeze_params_is_order_independent() -> None:
+    """Parameter order does not change the cache key."""
+    assert _freeze_params(None) is None
+    assert _freeze_params({}) is None
+    assert _freeze_params({"b": 1, "a": [1]}) == _freeze_params({"a": [1], "b": 1})
+    hash(_freeze_params({"a": {"nested": [1]}, "b": {1, 2}}))
+
+
+def test_cache_false_bypasses_cache_and_conditional_headers() -> None:
+    """cache=False neither reads nor writes the response cache."""
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        return httpx.Response(200, json={"status": "success"}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    client.get("api-login.json", Payload, params={"password": "secret"}, cache=False)
+    client.get("api-login.json", Payload, params={"password": "secret"}, cache=False)
+
+    assert seen == [None, None]
+    assert len(client._response_cache) == 0
+
+
+def test_cache_keys_are_scoped_to_session() -> None:
+    """Responses and total counts cached for one session are not reused by another."""
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        return httpx.Response(200, json={"status": "success"}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    client.session_id = "sessionid000001"
+    client.get("api-test.json", Payload)
+    client._store_rec_total(client._rec_total_key("api-test.json", None, {}), 42)
+    client.session_id = "sessionid000002"
+    client.get("api-test.json", Payload)
+
+    assert seen == [None, None]
+    assert client._get_rec_total(client._rec_total_key("api-test.json", None, {})) is None
+
+    client.clear_cache()
+    assert len(client._response_cache) == 0
+    assert len(client._rec_total_cache) == 0
+
+
+@pytest.mark.parametrize("status", [502, 503])
+def test_failed_get_is_not_cached(status: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Gateway errors are retried and never stored in the response cache."""
+    monkeypatch.setattr("mcp_zentao.client.base_client.RETRY_BACKOFF", 0)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(status)
+        return httpx.Response(200, json={"status": "success"}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    assert client.get("api-test.json", Payload).status == "success"
+    assert calls == 2
+    assert len(client._response_cache) == 1
+
+
+def test_build_url_substitutes_path_params() -> None:
+    """Endpoint placeholders are filled from keyword arguments."""
+    client = BaseClient("http://zentao.test/zentao/")
+
+    url = client._build_url("api-getModel-bug-getById-bugID-{bug_id}.json", bug_id=5)
+    assert str(url) == "http://zentao.test/zentao/api-getModel-bug-getById-bugID-5.json"
+    assert str(client._build_url("api-getSessionID.json")) == "http://zentao.test/zentao/api-getSessionID.json"
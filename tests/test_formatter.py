@@ -0,0 +1,148 @@
+"""
+Tests for the HTML to Markdown conversion of ZenTao rich-text fields.
+
+The converter was rewritten from a chain of regular expressions to an
+``html.parser.HTMLParser`` subclass. ``PARITY_CASES`` pin the output the
+regex implementation produced for representative ZenTao HTML, and
+``DIVERGENCE_CASES`` document where the parser deliberately differs.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from mcp_zentao.formatter import convert_html_to_markdown
+
+BASE_URL = "http://zentao.example.com/"
+
+# (html, output of both the regex and the parser implementation)
+PARITY_CASES = {
+    "link": (
+        '<p>详见 <a href="http://example.com/doc?a=1&amp;b=2" target="_blank">文档</a></p>',
+        "详见 文档",
+    ),
+    "relative_image": (
+        '<p><img src="/zentao/file-read-12.png" alt="截图" /></p>',
+        "![截图](http://zentao.example.com/zentao/file-read-12.png)",
+    ),
+    "image_without_alt": (
+        '<img src="data/upload/1/a.png">',
+        "![image](data/upload/1/a.png)",
+    ),
+    "absolute_image_single_quotes": (
+        "<img alt='x' src='http://cdn.example.com/x.png'>",
+        "![x](http://cdn.example.com/x.png)",
+    ),
+    "uppercase_image": (
+        '<IMG SRC="/a.png" ALT="A">',
+        "![A](http://zentao.example.com/a.png)",
+    ),
+    "image_without_src": (
+        '<p>前<img alt="x">后</p>',
+        "前后",
+    ),
+    "lists": (
+        "<ul><li>第一步</li><li>第二步</li></ul><ol><li>一</li><li>二</li></ol>",
+        "第一步第二步一二",
+    ),
+    "nested_tags": (
+        '<p><span style="color:red"><strong>重要</strong>：<em>必须</em>修复</span></p>'
+        "<div><p>内层</p></div>",
+        "重要：必须修复\n\n内层",
+    ),
+    "entities": (
+        "<p>a &lt; b &amp;&amp; c &gt; d&nbsp;&nbsp;&quot;x&quot; &#39;y&#39; &copy; &#x4e2d;</p>",
+        "a < b && c > d  \"x\" 'y' © 中",
+    ),
+    "escaped_tags_stay_text": (
+        "&lt;p&gt;不是标签&lt;/p&gt;",
+        "<p>不是标签</p>",
+    ),
+    "empty_paragraphs": (
+        "<p></p><p></p><p></p><p>x</p>\n\n\n\n<p>y</p>",
+        "x\n\ny",
+    ),
+    "table": (
+        "<table><tr><td>a</td><td>b</td></tr></table>",
+        "ab",
+    ),
+    "pre": (
+        "<pre>code line</pre>",
+        "code line",
+    ),
+    "comment": (
+        "<!-- 注释 -->正文",
+        "正文",
+    ),
+    "script_text_kept": (
+        "<p>x</p><script>alert(1)</script>",
+        "x\nalert(1)",
+    ),
+    "plain_text": (
+        "纯文本 无标签",
+        "纯文本 无标签",
+    ),
+    "line_endings": (
+        "line1\r\nline2\rline3",
+        "line1\nline2\nline3",
+    ),
+}
+
+# (html, regex output, parser output)
+DIVERGENCE_CASES = {
+    # The regex only recognised "<br>" and "<br />" and silently dropped "<br/>".
+    "self_closing_br": (
+        "第一行<br />第二行<br>第三行<br/>第四行",
+        "第一行\n第二行\n第三行第四行",
+        "第一行\n第二行\n第三行\n第四行",
+    ),
+    # ZenTao joins step paragraphs with CRLF; the regex collapsed blank lines
+    # before normalising CRLF, leaving two empty lines between steps.
+    "crlf_between_paragraphs": (
+        "<p>[步骤]</p>\r\n<p>1. 打开页面</p>\r\n<p>[结果]</p>\r\n<p>报错</p>",
+        "[步骤]\n\n\n1. 打开页面\n\n\n[结果]\n\n\n报错",
+        "[步骤]\n\n1. 打开页面\n\n[结果]\n\n报错",
+    ),
+    # The paragraph regex was case sensitive.
+    "uppercase_paragraph": (
+        "<P>大写</P>text",
+        "大写text",
+        "大写\ntext",
+    ),
+    # The tag regex removed everything between a literal "<" and the next ">".
+    "bare_angle_brackets": (
+        "a < b and c > d",
+        "a  d",
+        "a < b and c > d",
+    ),
+}
+
+
+@pytest.mark.parametrize(("html", "expected"), PARITY_CASES.values(), ids=PARITY_CASES.keys())
+def test_matches_regex_implementation(html: str, expected: str) -> None:
+    """Representative ZenTao HTML converts exactly as before the rewrite."""
+    assert convert_html_to_markdown(html, BASE_URL) == expected
+
+
+@pytest.mark.parametrize(
+    ("html", "regex_output", "expected"), DIVERGENCE_CASES.values(), ids=DIVERGENCE_CASES.keys()
+)
+def test_documented_divergences(html: str, regex_output: str, expected: str) -> None:
+    """Inputs the regex implementation mangled are now converted faithfully."""
+    result = convert_html_to_markdown(html, BASE_URL)
+    assert result == expected
+    assert result != regex_output
+
+
+@pytest.mark.parametrize("html", [None, ""])
+def test_empty_input(html: str | None) -> None:
+    """Missing rich-text fields convert to an empty string."""
+    assert convert_html_to_markdown(html, BASE_URL) == ""
+
+
+def test_base_url_trailing_slash_is_ignored() -> None:
+    """Relative image paths are joined to the base URL with a single slash."""
+    html = '<img src="/file-read-1.png">'
+    expected = "![image](http://zentao.example.com/file-read-1.png)"
+    assert convert_html_to_markdown(html, "http://zentao.example.com") == expected
+    assert convert_html_to_markdown(html, "http://zentao.example.com///") == expected
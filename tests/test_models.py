@@ -0,0 +1,188 @@
+"""
+Offline tests for the ZenTao data models.
+
+These cover the places where the models deliberately diverge from the raw
+ZenTao payloads, so that changes to the public model API are caught early.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_zentao.models.bug import ActionHistoryItem, BugAction, BugModel
+from mcp_zentao.models.project import ProjectModel
+from mcp_zentao.models.task import TaskModel
+
+
+def bug_payload(**overrides: Any) -> dict[str, Any]:
+    """Return a minimal bug payload as ZenTao serialises it."""
+    payload: dict[str, Any] = {
+        "id": "1", "product": "1", "branch": "0", "module": "0", "project": "1",
+        "plan": "0", "story": "0", "storyVersion": "1", "task": "0", "toTask": "0",
+        "toStory": "0", "title": "登录失败", "severity": "3", "pri": "2",
+        "type": "codeerror", "status": "active", "confirmed": "0",
+        "openedBy": "admin", "openedDate": "2024-01-01 10:00:00", "openedBuild": "trunk",
+        "assignedTo": "dev", "assignedDate": "2024-01-01 10:00:00",
+        "resolvedDate": "0000-00-00 00:00:00", "closedDate": "0000-00-00 00:00:00",
+        "activatedDate": "0000-00-00 00:00:00", "activatedCount": "0",
+        "lastEditedBy": "", "lastEditedDate": "0000-00-00 00:00:00", "deleted": "0",
+        "duplicateBug": "0", "linkBug": "", "case": "0", "caseVersion": "1", "result": "0",
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("1", True), ("0", False), (1, True), (0, False), (True, True), (False, False), ("", False)],
+)
+@pytest.mark.parametrize("field", ["confirmed", "deleted"])
+def test_bug_flags_are_parsed_as_bool(field: str, raw: Any, expected: bool) -> None:
+    """ZenTao's '1'/'0' flags become real booleans on BugModel."""
+    bug = BugModel.model_validate(bug_payload(**{field: raw}))
+    assert getattr(bug, field) is expected
+
+
+def test_bug_flags_drive_available_actions() -> None:
+    """Unconfirmed active bugs can be confirmed, confirmed ones resolved."""
+    unconfirmed = BugModel.model_validate(bug_payload(confirmed="0"))
+    confirmed = BugModel.model_validate(bug_payload(confirmed="1"))
+
+    assert unconfirmed.available_actions()["已确认"] is True
+    assert unconfirmed.available_actions()["已解决"] is False
+    assert confirmed.available_actions()["已确认"] is False
+    assert confirmed.available_actions()["已解决"] is True
+
+
+def test_bug_flags_from_json() -> None:
+    """Flags parsed straight from JSON bytes follow the same rules."""
+    bug = BugModel.model_validate_json(json.dumps(bug_payload(confirmed="1", deleted="0")))
+    assert bug.confirmed is True
+    assert bug.deleted is False
+
+
+def action_payload(**overrides: Any) -> dict[str, Any]:
+    """Return a minimal bug action payload with one history entry."""
+    payload: dict[str, Any] = {
+        "id": "10", "objectType": "bug", "objectID": "1", "product": "1", "project": "1",
+        "actor": "admin", "action": "edited", "date": "2024-01-02 09:00:00",
+        "read": "0", "efforted": "0",
+        "history": [
+            {"id": "100", "action": "10", "field": "title", "old": "旧标题", "new": "新标题"},
+        ],
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_action_history_items_are_dataclasses() -> None:
+    """History entries are parsed into frozen ActionHistoryItem dataclasses."""
+    history = BugAction.model_validate(action_payload()).history
+
+    assert len(history) == 1
+    item = history[0]
+    assert isinstance(item, ActionHistoryItem)
+    assert dataclasses.is_dataclass(item)
+    assert not hasattr(item, "__dict__")
+    assert item.diff == ""
+    assert str(item) == "title: 旧标题 → 新标题"
+    assert repr(item) == "ActionHistoryItem(field='title', old='旧标题', new='新标题')"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        item.new = "其他"  # type: ignore[misc]
+
+
+def test_action_history_ignores_unknown_keys_and_validates_types() -> None:
+    """Unknown keys are dropped; missing or mistyped fields still fail validation."""
+    entry = {"id": "100", "action": "10", "field": "title", "old": "a", "new": "b", "extra": "x"}
+    item = BugAction.model_validate(action_payload(history=[entry])).history[0]
+    assert dataclasses.asdict(item) == {
+        "id": "100", "action": "10", "field": "title", "old": "a", "new": "b", "diff": "",
+    }
+
+    with pytest.raises(ValidationError):
+        BugAction.model_validate(action_payload(history=[{"id": "100", "field": "title"}]))
+    with pytest.raises(ValidationError):
+        BugAction.model_validate(action_payload(history=[dict(entry, old=1)]))
+
+
+def test_action_history_serialises_with_the_action() -> None:
+    """BugAction.model_dump still renders history entries as plain dicts."""
+    action = BugAction.model_validate(action_payload())
+
+    assert action.model_dump()["history"] == [
+        {"id": "100", "action": "10", "field": "title", "old": "旧标题", "new": "新标题", "diff": ""},
+    ]
+    assert json.loads(action.model_dump_json())["history"][0]["new"] == "新标题"
+
+
+def task_payload(**overrides: Any) -> dict[str, Any]:
+    """Return a minimal task payload as ZenTao serialises it."""
+    payload: dict[str, Any] = {
+        "id": "7", "parent": "0", "project": "1", "module": "0", "story": "0",
+        "storyVersion": "1", "fromBug": "0", "name": "实现登录", "type": "devel", "pri": "3",
+        "estimate": "4", "consumed": "1", "left": "3", "deadline": "2024-02-01",
+        "estStarted": "2024-01-01", "realStarted": "2024-01-02", "status": "doing",
+        "openedBy": "admin", "openedDate": "2024-01-01 10:00:00",
+        "assignedTo": "dev", "assignedDate": "2024-01-01 10:00:00",
+        "finishedDate": "0000-00-00 00:00:00", "canceledDate": "0000-00-00 00:00:00",
+        "closedDate": "0000-00-00 00:00:00", "lastEditedBy": "",
+        "lastEditedDate": "0000-00-00 00:00:00", "deleted": "0",
+        "projectID": "1", "projectName": "示例项目", "needConfirm": False, "progress": 25,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def project_payload(**overrides: Any) -> dict[str, Any]:
+    """Return a minimal my-project listing entry as ZenTao serialises it."""
+    payload: dict[str, Any] = {
+        "id": "1", "root": "0", "type": "sprint", "parent": "0", "isCat": "0", "catID": "0",
+        "name": "示例项目", "code": "demo", "begin": "2024-01-01", "end": "2024-06-30",
+        "status": "doing", "statge": "1", "pri": "1", "openedBy": "admin",
+        "openedDate": "2024-01-01 10:00:00", "openedVersion": "12.0",
+        "closedDate": "0000-00-00 00:00:00", "canceledDate": "0000-00-00 00:00:00",
+        "team": "示例团队", "acl": "open", "account": "dev", "role": "dev", "limited": "no",
+        "join": "2024-01-01", "days": "120", "hours": "0", "estimate": "0", "consumed": "0",
+        "left": "0", "order": "5", "deleted": "0",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_task_display_fields_returns_plain_dict_in_order() -> None:
+    """TaskModel.display_fields returns a plain dict in ZenTao column order."""
+    fields = TaskModel.model_validate(task_payload()).display_fields()
+
+    assert type(fields) is dict
+    assert list(fields.items()) == [
+        ("ID", "7"), ("P", 3), ("所属项目", "示例项目"), ("任务名称", "实现登录"),
+        ("创建", "admin"), ("指派给", "dev"), ("由谁完成", ""), ("预计", "4"),
+        ("消耗", "1"), ("剩余", "3"), ("截止", "2024-02-01"), ("状态", "进行中"),
+    ]
+
+
+def test_project_display_fields_returns_plain_dict_in_order() -> None:
+    """ProjectModel.display_fields returns a plain dict in ZenTao column order."""
+    fields = ProjectModel.model_validate(project_payload()).display_fields()
+
+    assert type(fields) is dict
+    assert list(fields.items()) == [
+        ("ID", "1"), ("项目代号", "demo"), ("项目名称", "示例项目"),
+        ("开始日期", "2024-01-01"), ("截止日期", "2024-06-30"), ("状态", "进行中"),
+        ("角色", "开发人员"), ("加盟日", "2024-01-01"), ("可用工时/天", "8.0"),
+    ]
+
+
+def test_bug_display_fields_returns_plain_dict_in_order() -> None:
+    """BugModel.display_fields returns a plain dict in ZenTao column order."""
+    fields = BugModel.model_validate(bug_payload()).display_fields()
+
+    assert type(fields) is dict
+    assert list(fields) == ["ID", "级别", "P", "类型", "Bug标题", "创建", "指派给", "解决", "方案"]
+    assert fields["级别"] == "一般"
+    assert fields["方案"] == ""
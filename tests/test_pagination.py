@@ -0,0 +1,185 @@
+"""
+Offline tests for BaseClient pagination helpers.
+
+Pages are served by ``httpx.MockTransport`` so the concurrent page fetching
+in ``iter_all_pages`` and ``_map_concurrently`` can be checked without a
+ZenTao server.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from mcp_zentao.client.base_client import BaseClient
+
+REC_TOTAL = 45
+
+_PAGE_RE = re.compile(r"my-task(?:-assignedTo-id_desc-(\d+)-(\d+)-(\d+))?\.json$")
+
+
+class PageResponse(BaseModel):
+    """Minimal paginated response whose data is a JSON string, like ZenTao's."""
+
+    status: str
+    data: str = ""
+
+    @property
+    def page(self) -> int:
+        return json.loads(self.data)["page"]
+
+
+def page_handler(
+    delay: Callable[[int], float] = lambda page: 0.0,
+    fail_page: int | None = None,
+) -> tuple[Callable[[httpx.Request], httpx.Response], dict[str, Any]]:
+    """Serve REC_TOTAL records in pages and record the requests made."""
+    stats: dict[str, Any] = {"pages": [], "active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        match = _PAGE_RE.search(request.url.path)
+        assert match, request.url.path
+        page = int(match.group(3) or 1)
+        with lock:
+            stats["pages"].append(page)
+            stats["active"] += 1
+            stats["peak"] = max(stats["peak"], stats["active"])
+        time.sleep(delay(page))
+        with lock:
+            stats["active"] -= 1
+        if page == fail_page:
+            return httpx.Response(200, json={"status": "fail", "message": "无权限"})
+        data = json.dumps({"recTotal": REC_TOTAL, "page": page})
+        return httpx.Response(200, json={"status": "success", "data": data})
+
+    return handler, stats
+
+
+def make_client(handler: Callable[[httpx.Request], httpx.Response]) -> BaseClient:
+    """Build a client whose HTTP traffic is served by ``handler``."""
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    return BaseClient("http://zentao.test", client=http)
+
+
+def test_iter_all_pages_fetches_concurrently_in_page_order() -> None:
+    """Later pages are fetched in parallel but yielded in page order."""
+    # Page 2 is slow, so page 3 completes before it.
+    handler, stats = page_handler(delay=lambda page: 0.1 if page == 2 else 0.0)
+    client = make_client(handler)
+
+    pages = [response.page for response in client.iter_all_pages("my-task", PageResponse)]
+
+    assert pages == [1, 2, 3]
+    assert sorted(stats["pages"]) == [1, 2, 3]
+    assert stats["pages"][0] == 1
+
+
+def test_remaining_pages_overlap() -> None:
+    """Remaining pages are in flight at the same time."""
+    handler, stats = page_handler(delay=lambda page: 0.1 if page > 1 else 0.0)
+    client = make_client(handler)
+
+    client.get_all_pages("my-task", PageResponse, per_page=10)
+
+    assert sorted(stats["pages"]) == [1, 2, 3, 4, 5]
+    assert stats["peak"] > 1
+
+
+def test_get_all_pages_respects_max_pages() -> None:
+    """max_pages caps how many pages are requested."""
+    handler, stats = page_handler()
+    client = make_client(handler)
+
+    responses = client.get_all_pages("my-task", PageResponse, max_pages=2)
+
+    assert [response.page for response in responses] == [1, 2]
+    assert sorted(stats["pages"]) == [1, 2]
+
+
+def test_failed_page_stops_iteration_and_logs(caplog: pytest.LogCaptureFixture) -> None:
+    """A failing page ends iteration after the pages before it and logs a warning."""
+    handler, _ = page_handler(fail_page=2)
+    client = make_client(handler)
+
+    with caplog.at_level(logging.WARNING, logger="mcp_zentao.client.base_client"):
+        pages = [response.page for response in client.iter_all_pages("my-task", PageResponse)]
+
+    assert pages == [1]
+    assert "获取第2页失败" in caplog.text
+
+
+def test_iter_all_pages_can_stop_early() -> None:
+    """Closing the iterator after the first page does not raise."""
+    handler, _ = page_handler(delay=lambda page: 0.05)
+    client = make_client(handler)
+
+    iterator = client.iter_all_pages("my-task", PageResponse, per_page=5)
+    assert next(iterator).page == 1
+    iterator.close()
+
+
+def test_get_paginated_reuses_discovered_rec_total() -> None:
+    """After iterating, a later page is fetched directly without re-reading page 1."""
+    handler, stats = page_handler()
+    client = make_client(handler)
+    client.get_all_pages("my-task", PageResponse)
+    client.clear_cache("my-task-")
+    stats["pages"].clear()
+
+    assert client.get_paginated("my-task", PageResponse, page=3).page == 3
+    assert stats["pages"] == [3]
+
+
+def test_extract_rec_total_logs_malformed_data(caplog: pytest.LogCaptureFixture) -> None:
+    """Unparseable pagination data falls back to zero with a warning."""
+    client = BaseClient("http://zentao.test")
+
+    with caplog.at_level(logging.WARNING, logger="mcp_zentao.client.base_client"):
+        assert client._extract_rec_total(PageResponse(status="success", data="{not json")) == 0
+
+    assert "提取总记录数失败" in caplog.text
+
+
+def test_map_concurrently_preserves_input_order() -> None:
+    """Results come back in input order even when later items finish first."""
+    client = BaseClient("http://zentao.test")
+    threads: set[int] = set()
+
+    def work(item: int) -> int:
+        threads.add(threading.get_ident())
+        time.sleep(0.01 * (5 - item))
+        return item * 10
+
+    assert client._map_concurrently(work, [1, 2, 3, 4]) == [10, 20, 30, 40]
+    assert len(threads) > 1
+
+
+def test_map_concurrently_small_inputs_run_inline() -> None:
+    """Zero or one item is processed on the calling thread."""
+    client = BaseClient("http://zentao.test")
+    caller = threading.get_ident()
+
+    assert client._map_concurrently(lambda item: item, []) == []
+    assert client._map_concurrently(lambda item: threading.get_ident(), ["x"]) == [caller]
+
+
+def test_map_concurrently_propagates_errors() -> None:
+    """The first failing call's exception is raised to the caller."""
+    client = BaseClient("http://zentao.test")
+
+    def work(item: int) -> int:
+        if item == 2:
+            raise ValueError("bad item")
+        return item
+
+    with pytest.raises(ValueError, match="bad item"):
+        client._map_concurrently(work, [1, 2, 3])